@@ -3,13 +3,78 @@ Agent Orchestrator - Routes requests to different LLM agents within a startup wo
 Each agent is an OpenAI conversation with persistent memory, not a running process.
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional, AsyncGenerator
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pathlib import Path
 
+# Tool arguments and results are (de)serialized on every tool call; orjson
+# does that several times faster than stdlib json. Optional, like elsewhere
+# in the codebase: fall back to stdlib when it isn't installed.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# How many stored messages to replay to the model per invocation. Sending the
+# full conversation file makes every call slower and more expensive as history
+# grows; long-lived agents can blow past the context window entirely.
+AGENT_HISTORY_WINDOW = int(os.getenv("AGENT_HISTORY_WINDOW", "40"))
+
+# Stored tool results can run to many KB (file dumps, repo listings). Replaying
+# them verbatim on every later turn inflates prompt tokens and prefill time
+# long after the result stopped mattering, so oversized ones are compacted.
+TOOL_RESULT_REPLAY_LIMIT = int(os.getenv("TOOL_RESULT_REPLAY_LIMIT", "2000"))
+_TOOL_RESULT_KEEP_CHARS = 500
+
+# Fallback roster when agent_configs isn't importable; immutable by intent,
+# allocated once instead of per call
+_FALLBACK_AGENT_TYPES = ["ceo", "frontend", "backend", "design", "testing"]
+
+# Startup names by startup_id, shared across orchestrator instances. The name
+# is fixed at workspace creation, but orchestrators are built per request, so
+# without this every request re-reads workspace metadata off the volume just
+# to format the system prompt.
+_STARTUP_NAME_CACHE: Dict[str, str] = {}
+
+# Bound on in-flight OpenAI requests per process (same knob as
+# PersistentAgent). Concurrent orchestrators share one API key; without a
+# bound a burst of invocations trips rate limits and stacks retries.
+_OPENAI_SEMAPHORE = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")))
+
+# Same knobs as PersistentAgent: lets deployments point the orchestrator at a
+# cheaper/faster model (e.g. gpt-4o-mini) and bound response length without a
+# code change. Completions decode sequentially server-side, so an uncapped
+# response costs wall-clock as well as tokens.
+AGENT_CHAT_MODEL = os.getenv("AGENT_CHAT_MODEL", "gpt-4")
+AGENT_TEMPERATURE = float(os.getenv("AGENT_TEMPERATURE", "0.7"))
+AGENT_MAX_TOKENS = int(os.getenv("AGENT_MAX_TOKENS", "1000"))
+
+# One pooled httpx client per process. Orchestrators are constructed per
+# request, and without a shared transport each one pays a TCP+TLS handshake
+# to api.openai.com; keep-alive connections make that a one-time cost.
+_openai_http_client = None
+
+
+def _shared_http_client():
+    """Pooled httpx client, created once per process."""
+    global _openai_http_client
+    if _openai_http_client is None:
+        import httpx
+        _openai_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+        )
+    return _openai_http_client
+
 
 class AgentOrchestrator:
     """
@@ -27,14 +92,24 @@ class AgentOrchestrator:
         openai_key = os.getenv("OPENAI_API_KEY")
         if not openai_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
-        self.openai = OpenAI(api_key=openai_key)
+        self.openai = AsyncOpenAI(api_key=openai_key, http_client=_shared_http_client())
+
+        # System prompts are deterministic per agent type (startup name and
+        # workspace path don't change mid-session), so format them once and
+        # reuse instead of re-reading workspace metadata on every message.
+        self._system_prompt_cache: Dict[str, str] = {}
+
+        # Tool schemas are pure data per agent type; build the filtered list
+        # once instead of re-allocating every schema dict on each invocation
+        self._agent_tools_cache: Dict[str, List[Dict[str, Any]]] = {}
 
         # Initialize MCP tools with clean auto-registration
         self.mcp_tools = None
         try:
             # Import with fallbacks for different environments
             import sys
-            sys.path.insert(0, "/root")
+            if "/root" not in sys.path:
+                sys.path.insert(0, "/root")
             from mcp_tools import MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP, GitHubCoordinationMCP, TeamToolsMCP
         except ImportError:
             from .mcp_tools import MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP, GitHubCoordinationMCP, TeamToolsMCP
@@ -104,8 +179,43 @@ class AgentOrchestrator:
             print(f"❌ Error loading memory for agent '{agent_type}': {e}")
             return []
 
+    def _recent_history(self, conversation_history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Return the last AGENT_HISTORY_WINDOW messages, trimming any leading
+        tool-result messages so the slice never starts with a tool response
+        whose originating assistant tool_calls message was cut off.
+        """
+        recent = conversation_history[-AGENT_HISTORY_WINDOW:]
+        while recent and recent[0].get("role") == "tool":
+            recent = recent[1:]
+
+        # Compact oversized tool outputs (copying the entry so the stored
+        # history keeps the full result on disk)
+        compacted = []
+        for entry in recent:
+            content = entry.get("content")
+            if (entry.get("role") == "tool" and isinstance(content, str)
+                    and len(content) > TOOL_RESULT_REPLAY_LIMIT):
+                entry = dict(entry)
+                entry["content"] = content[:_TOOL_RESULT_KEEP_CHARS] + "...(truncated)"
+            compacted.append(entry)
+        return compacted
+
     def save_agent_memory(self, agent_type: str, new_message: Dict[str, str]):
         """Save new message to agent's conversation history."""
+        self.save_agent_memory_batch(agent_type, [new_message])
+
+    def save_agent_memory_batch(self, agent_type: str, new_messages: List[Dict[str, str]]):
+        """
+        Save a batch of messages to agent's conversation history.
+
+        An agent turn can produce several messages (assistant, tool results,
+        user); loading and rewriting conversation.json once per turn instead
+        of once per message keeps the file I/O constant as turns grow.
+        """
+        if not new_messages:
+            return
+
         agent_path = self.agents_memory_path / agent_type
         agent_path.mkdir(parents=True, exist_ok=True)
 
@@ -123,8 +233,8 @@ class AgentOrchestrator:
                 "messages": []
             }
 
-        # Add new message
-        data["messages"].append(new_message)
+        # Add new messages in order
+        data["messages"].extend(new_messages)
         data["last_active"] = datetime.now().isoformat()
         data["conversation_count"] = len(data["messages"])
 
@@ -132,19 +242,35 @@ class AgentOrchestrator:
         with open(conversation_file, "w") as f:
             json.dump(data, f, indent=2)
 
-        print(f"💾 Saved message for agent '{agent_type}' (total: {len(data['messages'])})")
+        print(f"💾 Saved {len(new_messages)} message(s) for agent '{agent_type}' (total: {len(data['messages'])})")
 
     def get_agent_system_prompt(self, agent_type: str) -> str:
-        """Get system prompt for a specific agent type."""
+        """Get system prompt for a specific agent type (cached per agent)."""
+        cached = self._system_prompt_cache.get(agent_type)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_agent_system_prompt(agent_type)
+        self._system_prompt_cache[agent_type] = prompt
+        return prompt
+
+    def _build_agent_system_prompt(self, agent_type: str) -> str:
+        """Build the system prompt for a specific agent type."""
         try:
             from agent_configs import AGENT_CONFIGS
             config = AGENT_CONFIGS.get(agent_type)
             if not config:
                 raise ValueError(f"Unknown agent type: {agent_type}")
 
-            # Customize prompt with startup context
-            workspace_info = self.workspace_manager.get_workspace_info(self.startup_id)
-            startup_name = workspace_info.get("metadata", {}).get("startup_name", f"Startup {self.startup_id}")
+            # Customize prompt with startup context (name cached process-wide;
+            # it never changes after workspace creation)
+            startup_name = _STARTUP_NAME_CACHE.get(self.startup_id)
+            if startup_name is None:
+                workspace_info = self.workspace_manager.get_workspace_info(self.startup_id)
+                startup_name = (workspace_info or {}).get("metadata", {}).get(
+                    "startup_name", f"Startup {self.startup_id}"
+                )
+                _STARTUP_NAME_CACHE[self.startup_id] = startup_name
 
             system_prompt = config["system_prompt"].format(
                 startup_name=startup_name,
@@ -167,11 +293,21 @@ Current workspace: {self.workspace_path}
 """
 
     def get_agent_tools(self, agent_type: str) -> List[Dict[str, Any]]:
-        """Get tools available to a specific agent type."""
+        """Get tools available to a specific agent type (cached per agent)."""
         if not self.mcp_tools:
             print(f"❌ No MCP tools available for agent '{agent_type}'")
             return []
 
+        cached = self._agent_tools_cache.get(agent_type)
+        if cached is not None:
+            return cached
+
+        tools = self._build_agent_tools(agent_type)
+        self._agent_tools_cache[agent_type] = tools
+        return tools
+
+    def _build_agent_tools(self, agent_type: str) -> List[Dict[str, Any]]:
+        """Build the filtered tool schema list for a specific agent type."""
         try:
             from agent_configs import AGENT_CONFIGS
             config = AGENT_CONFIGS.get(agent_type, {})
@@ -223,8 +359,8 @@ Current workspace: {self.workspace_path}
             {"role": "system", "content": self.get_agent_system_prompt(agent_type)}
         ]
 
-        # Add conversation history
-        messages.extend(conversation_history)
+        # Add recent conversation history (bounded window)
+        messages.extend(self._recent_history(conversation_history))
 
         # Add current message
         messages.append({"role": "user", "content": message})
@@ -233,25 +369,28 @@ Current workspace: {self.workspace_path}
         tools = self.get_agent_tools(agent_type)
 
         try:
-            # Call OpenAI
-            response = self.openai.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                tools=tools if tools else None,
-                tool_choice="auto" if tools else None,
-                temperature=0.7
-            )
+            # Call OpenAI (initiation gated by the per-process semaphore)
+            async with _OPENAI_SEMAPHORE:
+                response = await self.openai.chat.completions.create(
+                    model=AGENT_CHAT_MODEL,
+                    messages=messages,
+                    tools=tools if tools else None,
+                    tool_choice="auto" if tools else None,
+                    temperature=AGENT_TEMPERATURE,
+                    max_tokens=AGENT_MAX_TOKENS
+                )
 
             assistant_message = response.choices[0].message
             response_content = assistant_message.content or ""
             tools_used = []
+            turn_messages = []
 
             # Handle tool calls if any
             if assistant_message.tool_calls:
                 print(f"🔧 Agent '{agent_type}' is using {len(assistant_message.tool_calls)} tools")
 
-                # Save the assistant message with tool calls
-                self.save_agent_memory(agent_type, {
+                # Record the assistant message with tool calls
+                turn_messages.append({
                     "role": "assistant",
                     "content": response_content,
                     "tool_calls": [
@@ -268,51 +407,64 @@ Current workspace: {self.workspace_path}
                     "timestamp": datetime.now().isoformat()
                 })
 
-                # Execute tools using MCP framework
+                # Execute tools concurrently - the calls in a single model
+                # turn are independent, so a slow tool shouldn't serialize
+                # the rest of the batch
                 if self.mcp_tools:
-                    for tool_call in assistant_message.tool_calls:
+                    parsed_calls = [
+                        (tool_call, _json_loads(tool_call.function.arguments))
+                        for tool_call in assistant_message.tool_calls
+                    ]
+                    results = await asyncio.gather(
+                        *(
+                            self.mcp_tools.execute_openai_function(tool_call.function.name, tool_args)
+                            for tool_call, tool_args in parsed_calls
+                        ),
+                        return_exceptions=True
+                    )
+
+                    for (tool_call, tool_args), tool_result in zip(parsed_calls, results):
                         tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-
-                        try:
-                            tool_result = await self.mcp_tools.execute_openai_function(tool_name, tool_args)
-                            tools_used.append({
-                                "name": tool_name,
-                                "arguments": tool_args,
-                                "result": tool_result
-                            })
-
-                            # Save tool result
-                            self.save_agent_memory(agent_type, {
-                                "role": "tool",
-                                "tool_call_id": tool_call.id,
-                                "name": tool_name,
-                                "content": json.dumps(tool_result),
-                                "timestamp": datetime.now().isoformat()
-                            })
 
-                        except Exception as e:
-                            print(f"❌ Tool execution failed: {tool_name}: {e}")
+                        if isinstance(tool_result, Exception):
+                            print(f"❌ Tool execution failed: {tool_name}: {tool_result}")
                             tools_used.append({
                                 "name": tool_name,
                                 "arguments": tool_args,
-                                "error": str(e)
+                                "error": str(tool_result)
                             })
+                            continue
+
+                        tools_used.append({
+                            "name": tool_name,
+                            "arguments": tool_args,
+                            "result": tool_result
+                        })
+
+                        # Record tool result (in original tool_call order)
+                        turn_messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "name": tool_name,
+                            "content": _json_dumps(tool_result),
+                            "timestamp": datetime.now().isoformat()
+                        })
 
             else:
-                # Save regular assistant message
-                self.save_agent_memory(agent_type, {
+                # Record regular assistant message
+                turn_messages.append({
                     "role": "assistant",
                     "content": response_content,
                     "timestamp": datetime.now().isoformat()
                 })
 
-            # Save user message
-            self.save_agent_memory(agent_type, {
+            # Record user message, then persist the whole turn in one write
+            turn_messages.append({
                 "role": "user",
                 "content": message,
                 "timestamp": datetime.now().isoformat()
             })
+            self.save_agent_memory_batch(agent_type, turn_messages)
 
             return {
                 "content": response_content,
@@ -347,22 +499,25 @@ Current workspace: {self.workspace_path}
         messages = [
             {"role": "system", "content": self.get_agent_system_prompt(agent_type)}
         ]
-        messages.extend(conversation_history)
+        messages.extend(self._recent_history(conversation_history))
         messages.append({"role": "user", "content": message})
 
         # Get agent-specific tools
         tools = self.get_agent_tools(agent_type)
 
         try:
-            # Stream OpenAI response
-            response_stream = self.openai.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                tools=tools if tools else None,
-                tool_choice="auto" if tools else None,
-                temperature=0.7,
-                stream=True
-            )
+            # Stream OpenAI response (request initiation gated by the
+            # semaphore; consuming the stream is not serialized)
+            async with _OPENAI_SEMAPHORE:
+                response_stream = await self.openai.chat.completions.create(
+                    model=AGENT_CHAT_MODEL,
+                    messages=messages,
+                    tools=tools if tools else None,
+                    tool_choice="auto" if tools else None,
+                    temperature=AGENT_TEMPERATURE,
+                    max_tokens=AGENT_MAX_TOKENS,
+                    stream=True
+                )
 
             # Let MCP framework handle streaming + tool execution
             if self.mcp_tools:
@@ -388,23 +543,25 @@ Current workspace: {self.workspace_path}
             else:
                 # Fallback streaming without tools
                 full_response = ""
-                for chunk in response_stream:
+                async for chunk in response_stream:
                     content = chunk.choices[0].delta.content
                     if content:
                         full_response += content
                         yield {"type": "content", "content": content}
 
-                # Save conversation
-                self.save_agent_memory(agent_type, {
-                    "role": "user",
-                    "content": message,
-                    "timestamp": datetime.now().isoformat()
-                })
-                self.save_agent_memory(agent_type, {
-                    "role": "assistant",
-                    "content": full_response,
-                    "timestamp": datetime.now().isoformat()
-                })
+                # Save conversation (both messages in one write)
+                self.save_agent_memory_batch(agent_type, [
+                    {
+                        "role": "user",
+                        "content": message,
+                        "timestamp": datetime.now().isoformat()
+                    },
+                    {
+                        "role": "assistant",
+                        "content": full_response,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                ])
 
         except Exception as e:
             error_msg = f"Streaming failed for agent '{agent_type}': {str(e)}"
@@ -461,9 +618,9 @@ Current workspace: {self.workspace_path}
             return list(AGENT_CONFIGS.keys())
         except ImportError:
             # Fallback list
-            return ["ceo", "frontend", "backend", "design", "testing"]
+            return _FALLBACK_AGENT_TYPES
 
-    def cross_agent_communication(self, from_agent: str, to_agent: str, message: str) -> Dict[str, Any]:
+    async def cross_agent_communication(self, from_agent: str, to_agent: str, message: str) -> Dict[str, Any]:
         """Enable communication between agents."""
         context = {
             "from_agent": from_agent,
@@ -471,4 +628,4 @@ Current workspace: {self.workspace_path}
             "timestamp": datetime.now().isoformat()
         }
 
-        return self.invoke_agent(to_agent, message, context)
\ No newline at end of file
+        return await self.invoke_agent(to_agent, message, context)
\ No newline at end of file
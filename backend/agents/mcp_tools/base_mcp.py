@@ -5,19 +5,139 @@ Provides foundation for all CEO tools with workspace context and safety.
 
 import os
 import json
+import time
+import atexit
 import asyncio
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, Any, Optional, List, Callable
 from abc import ABC, abstractmethod
 from functools import wraps
 
 
+# Log entries are serialized on every tool action (at least twice per
+# execute); orjson encodes them several times faster than stdlib json.
+# Optional, like elsewhere in the codebase: fall back when not installed.
+try:
+    import orjson
+
+    def _log_line(obj: Any) -> str:
+        return orjson.dumps(obj).decode() + "\n"
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _log_line(obj: Any) -> str:
+        return json.dumps(obj) + "\n"
+
+    _json_loads = json.loads
+
+
+# (second, formatted) pair for _now_iso; log timestamps only need second
+# granularity, and building a datetime plus isoformat() per line adds up
+# at two log events per tool action
+_ts_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Local ISO-8601 timestamp, reformatted at most once per second."""
+    global _ts_cache
+    sec = int(time.time())
+    cached_sec, formatted = _ts_cache
+    if sec != cached_sec:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, formatted)
+    return formatted
+
+
 class MCPToolError(Exception):
     """Base exception for MCP tool operations."""
     pass
 
 
+class _LogWriter:
+    """
+    Background batcher for activity-log appends.
+
+    log_activity runs on the event-loop thread, and every tool action emits
+    at least two log events across two files. Writing them synchronously
+    blocks the loop on disk per event; instead entries are queued and a
+    single drain task flushes everything pending with one write per file.
+    Outside an event loop (sync callers, tests) entries are written directly.
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._task = None
+        # Raw append descriptors cached per path: each open() is an
+        # openat+fstat+close triple, repeated thousands of times per agent
+        # session, and O_APPEND keeps concurrent writers from interleaving
+        self._fds: Dict[Path, int] = {}
+        atexit.register(self.close)
+
+    def _fd(self, path: Path) -> int:
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._fds[path] = fd
+        return fd
+
+    def close(self):
+        """Flush any queued entries, then close all cached descriptors."""
+        # The drain task dies with the event loop; these files are the
+        # tools' audit trail, so write whatever is still queued directly
+        # before giving up the descriptors
+        queue = self._queue
+        if queue is not None:
+            batches: Dict[Path, List[str]] = {}
+            while not queue.empty():
+                path, line = queue.get_nowait()
+                batches.setdefault(path, []).append(line)
+            if batches:
+                try:
+                    self._write_batches(batches)
+                except OSError:
+                    pass
+
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+
+    def emit(self, path: Path, line: str):
+        """Queue one log line for path; non-blocking under a running loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_batches({path: [line]})
+            return
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._queue.put_nowait((path, line))
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drain())
+
+    async def _drain(self):
+        queue = self._queue
+        while not queue.empty():
+            batches: Dict[Path, List[str]] = {}
+            while not queue.empty():
+                path, line = queue.get_nowait()
+                batches.setdefault(path, []).append(line)
+            await asyncio.to_thread(self._write_batches, batches)
+
+    def _write_batches(self, batches: Dict[Path, List[str]]):
+        for path, lines in batches.items():
+            # Single unbuffered syscall per batch: no TextIOWrapper encode
+            # step or flush needed, and tails see the lines immediately
+            os.write(self._fd(path), "".join(lines).encode())
+
+
+# One writer per process; all tools share the queue and drain task
+_log_writer = _LogWriter()
+
+
 def openai_function(name: str, description: str, parameters: Optional[Dict[str, Any]] = None):
     """
     Decorator to auto-register MCP methods as OpenAI functions.
@@ -38,6 +158,10 @@ def openai_function(name: str, description: str, parameters: Optional[Dict[str,
     return decorator
 
 
+# How long a workspace file count stays fresh before it is recounted
+_FILE_COUNT_TTL_SECONDS = 5.0
+
+
 class WorkspaceSecurityError(MCPToolError):
     """Raised when operation violates workspace boundaries."""
     pass
@@ -51,6 +175,27 @@ class BaseMCPTool(ABC):
     logging, error handling, and security boundaries.
     """
 
+    # Workspaces whose directory structure has already been created this
+    # process; every tool instantiation otherwise re-runs five mkdirs
+    _initialized_workspaces: set = set()
+
+    # method name -> @openai_function metadata, filled per subclass by
+    # __init_subclass__ (empty on the abstract base itself)
+    _openai_methods: Dict[str, Dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Decorated methods are fixed at class definition, so discover them
+        # here once instead of dir()-scanning every instance at
+        # registration. Walking the MRO base-first lets subclasses inherit
+        # and override decorated methods naturally.
+        methods: Dict[str, Dict[str, Any]] = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr in vars(klass).items():
+                if callable(attr) and hasattr(attr, '_openai_function'):
+                    methods[attr_name] = attr._openai_function
+        cls._openai_methods = methods
+
     def __init__(self, workspace_path: Path, startup_id: str):
         """Initialize tool with workspace context."""
         self.workspace = Path(workspace_path)
@@ -60,11 +205,25 @@ class BaseMCPTool(ABC):
         self.memory_path = self.workspace / "memory"
         self.docs_path = self.workspace / "docs"
 
+        # Canonical workspace root, resolved once. resolve() stats every
+        # path component, and _validate_path runs on every file operation.
+        self._workspace_resolved = self.workspace.resolve()
+        self._workspace_str = str(self._workspace_resolved)
+        self._workspace_prefix = self._workspace_str + os.sep
+
+        # Lazily-built cache for get_available_actions
+        self._actions_cache: Optional[List[str]] = None
+        # (monotonic timestamp, count) for get_workspace_status
+        self._file_count_cache = (0.0, 0)
+
         # Ensure required directories exist
         self._ensure_workspace_structure()
 
     def _ensure_workspace_structure(self):
         """Ensure all required workspace directories exist."""
+        if self._workspace_str in BaseMCPTool._initialized_workspaces:
+            return
+
         required_dirs = [
             self.tools_path,
             self.tools_path / "logs",
@@ -76,6 +235,8 @@ class BaseMCPTool(ABC):
         for directory in required_dirs:
             directory.mkdir(parents=True, exist_ok=True)
 
+        BaseMCPTool._initialized_workspaces.add(self._workspace_str)
+
     def _validate_path(self, path: str) -> Path:
         """
         Validate that a path is within workspace boundaries.
@@ -89,22 +250,28 @@ class BaseMCPTool(ABC):
         Raises:
             WorkspaceSecurityError: If path is outside workspace
         """
+        # Cheap lexical pre-filter: normpath collapses . and .. with zero
+        # syscalls, rejecting plain traversal attempts before any I/O
         if os.path.isabs(path):
-            resolved_path = Path(path)
+            abs_path = os.path.normpath(path)
         else:
-            resolved_path = self.workspace / path
+            abs_path = os.path.normpath(os.path.join(self._workspace_str, path))
 
-        # Resolve to handle .. and . components
-        resolved_path = resolved_path.resolve()
+        if abs_path != self._workspace_str and not abs_path.startswith(self._workspace_prefix):
+            raise WorkspaceSecurityError(
+                f"Path '{path}' is outside workspace boundaries"
+            )
 
-        # Check if path is within workspace
-        try:
-            resolved_path.relative_to(self.workspace.resolve())
-            return resolved_path
-        except ValueError:
+        # The containment decision must chase symlinks: cloned repos can
+        # carry links pointing outside the workspace (or into another
+        # startup's workspace on the shared volume), so compare the real
+        # path against the workspace root resolved once in __init__
+        real_path = os.path.realpath(abs_path)
+        if real_path != self._workspace_str and not real_path.startswith(self._workspace_prefix):
             raise WorkspaceSecurityError(
                 f"Path '{path}' is outside workspace boundaries"
             )
+        return Path(real_path)
 
     def log_activity(self, activity_type: str, details: Dict[str, Any], level: str = "info"):
         """
@@ -116,7 +283,7 @@ class BaseMCPTool(ABC):
             level: Log level ("info", "warning", "error")
         """
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "startup_id": self.startup_id,
             "tool": self.__class__.__name__,
             "activity": activity_type,
@@ -124,15 +291,15 @@ class BaseMCPTool(ABC):
             "details": details
         }
 
-        # Write to tool-specific log
+        line = _log_line(log_entry)
+
+        # Queue for the tool-specific log and the main activity log; the
+        # shared background writer batches pending lines per file
         log_file = self.tools_path / "logs" / f"{self.__class__.__name__.lower()}.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        _log_writer.emit(log_file, line)
 
-        # Also write to main activity log
         main_log = self.memory_path / "shared" / "activity.jsonl"
-        with open(main_log, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        _log_writer.emit(main_log, line)
 
     async def execute(self, action: str, **kwargs) -> Dict[str, Any]:
         """
@@ -145,7 +312,7 @@ class BaseMCPTool(ABC):
         Returns:
             Result dictionary with success status and data
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
             # Log action start
@@ -158,7 +325,7 @@ class BaseMCPTool(ABC):
             result = await self._execute_action(action, **kwargs)
 
             # Log successful completion
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             self.log_activity("action_complete", {
                 "action": action,
                 "execution_time_seconds": execution_time,
@@ -173,20 +340,22 @@ class BaseMCPTool(ABC):
             }
 
         except Exception as e:
-            # Log error
-            execution_time = (datetime.now() - start_time).total_seconds()
+            # Log error; stringify the exception once for both consumers
+            execution_time = time.monotonic() - start_time
+            error_message = str(e)
+            error_type = type(e).__name__
             self.log_activity("action_error", {
                 "action": action,
-                "error": str(e),
-                "error_type": type(e).__name__,
+                "error": error_message,
+                "error_type": error_type,
                 "execution_time_seconds": execution_time
             }, level="error")
 
             return {
                 "success": False,
                 "action": action,
-                "error": str(e),
-                "error_type": type(e).__name__,
+                "error": error_message,
+                "error_type": error_type,
                 "execution_time": execution_time
             }
 
@@ -206,13 +375,47 @@ class BaseMCPTool(ABC):
 
     def get_available_actions(self) -> List[str]:
         """Get list of available actions for this tool."""
-        # Default implementation returns methods that don't start with _
-        actions = []
-        for attr_name in dir(self):
-            if not attr_name.startswith('_') and callable(getattr(self, attr_name)):
-                if attr_name not in ['execute', 'log_activity', 'get_available_actions']:
-                    actions.append(attr_name)
-        return actions
+        # Default implementation returns methods that don't start with _.
+        # The dir() walk touches every attribute, so scan once and reuse:
+        # the method set is fixed after class definition.
+        if self._actions_cache is None:
+            actions = []
+            for attr_name in dir(self):
+                if not attr_name.startswith('_') and callable(getattr(self, attr_name)):
+                    if attr_name not in ['execute', 'log_activity', 'get_available_actions']:
+                        actions.append(attr_name)
+            self._actions_cache = actions
+        return self._actions_cache
+
+    def _count_workspace_files(self) -> int:
+        """
+        Count entries under the workspace, cached for a few seconds.
+
+        rglob("*") stats every file and allocates a Path per entry; for a
+        checked-out repo that is thousands of syscalls, and
+        get_all_tools_status repeats it for every registered tool. An
+        os.scandir walk with an explicit stack avoids the Path churn, and
+        the short TTL absorbs back-to-back status calls.
+        """
+        cached_at, count = self._file_count_cache
+        now = time.monotonic()
+        if now - cached_at < _FILE_COUNT_TTL_SECONDS:
+            return count
+
+        total = 0
+        stack = [self._workspace_str]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        total += 1
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+        self._file_count_cache = (now, total)
+        return total
 
     def get_workspace_status(self) -> Dict[str, Any]:
         """Get current workspace status and health."""
@@ -225,7 +428,7 @@ class BaseMCPTool(ABC):
                 self.memory_path.exists(),
                 self.docs_path.exists()
             ]),
-            "total_files": len(list(self.workspace.rglob("*"))) if self.workspace.exists() else 0
+            "total_files": self._count_workspace_files() if self.workspace.exists() else 0
         }
 
 
@@ -239,11 +442,31 @@ class MCPToolRegistry:
         self.workspace_path = workspace_path
         self.startup_id = startup_id
         self.tools: Dict[str, BaseMCPTool] = {}
+        # function name -> bound method, built once at registration so
+        # dispatch is a dict lookup instead of a dir() scan per call
+        self._function_index: Dict[str, Callable] = {}
+        # OpenAI schema list, likewise built at registration: it goes into
+        # every chat completion request and never changes afterwards
+        self._openai_schemas: List[Dict[str, Any]] = []
 
     def register_tool(self, name: str, tool_class, **kwargs):
-        """Register a tool instance."""
+        """Register a tool instance and index its OpenAI functions."""
         tool = tool_class(self.workspace_path, self.startup_id, **kwargs)
         self.tools[name] = tool
+
+        for method_name, func_def in type(tool)._openai_methods.items():
+            self._function_index[func_def["name"]] = getattr(tool, method_name)
+            self._openai_schemas.append({
+                "type": "function",
+                "function": {
+                    "name": func_def["name"],
+                    "description": func_def["description"],
+                    "parameters": func_def["parameters"]
+                },
+                "_mcp_tool": name,  # Internal routing info
+                "_mcp_method": func_def["method"]
+            })
+
         return tool
 
     async def execute_tool(self, tool_name: str, action: str, **kwargs) -> Dict[str, Any]:
@@ -259,48 +482,25 @@ class MCPToolRegistry:
 
     def get_all_openai_functions(self) -> List[Dict[str, Any]]:
         """
-        Auto-discover all OpenAI functions from registered tools.
-        Returns list ready for OpenAI API.
+        Return all OpenAI functions from registered tools.
+        Returns list ready for OpenAI API, built once at registration.
         """
-        functions = []
-
-        for tool_name, tool in self.tools.items():
-            # Get all methods with @openai_function decorator
-            for method_name in dir(tool):
-                method = getattr(tool, method_name)
-                if hasattr(method, '_openai_function'):
-                    func_def = method._openai_function
-                    functions.append({
-                        "type": "function",
-                        "function": {
-                            "name": func_def["name"],
-                            "description": func_def["description"],
-                            "parameters": func_def["parameters"]
-                        },
-                        "_mcp_tool": tool_name,  # Internal routing info
-                        "_mcp_method": func_def["method"]
-                    })
-
-        return functions
+        return list(self._openai_schemas)
 
     async def execute_openai_function(self, function_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute OpenAI function call by routing to appropriate MCP tool.
         """
-        # Find the function definition
-        for tool_name, tool in self.tools.items():
-            for method_name in dir(tool):
-                method = getattr(tool, method_name)
-                if hasattr(method, '_openai_function'):
-                    if method._openai_function["name"] == function_name:
-                        try:
-                            # Call the method with arguments
-                            result = await method(**arguments)
-                            return {"success": True, "result": result}
-                        except Exception as e:
-                            return {"success": False, "error": str(e)}
-
-        return {"success": False, "error": f"Function '{function_name}' not found"}
+        method = self._function_index.get(function_name)
+        if method is None:
+            return {"success": False, "error": f"Function '{function_name}' not found"}
+
+        try:
+            # Call the method with arguments
+            result = await method(**arguments)
+            return {"success": True, "result": result}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
     async def handle_streaming_response(self, openai_stream, save_conversation_callback=None):
         """
@@ -308,10 +508,13 @@ class MCPToolRegistry:
         Yields content chunks and handles function calls transparently.
         """
         content_chunks = []
-        tool_calls = []
+        # Keyed by delta index; name/argument fragments are buffered in
+        # lists and joined once at stream end, since += on strings inside
+        # the token loop is quadratic for large function arguments
+        tool_calls: Dict[int, Dict[str, Any]] = {}
 
         # Collect streaming chunks and tool calls
-        for chunk in openai_stream:
+        async for chunk in openai_stream:
             if chunk.choices and chunk.choices[0].delta:
                 delta = chunk.choices[0].delta
 
@@ -324,45 +527,53 @@ class MCPToolRegistry:
                 if delta.tool_calls:
                     for tool_call in delta.tool_calls:
                         # Handle incremental tool call building
-                        if len(tool_calls) <= tool_call.index:
-                            tool_calls.extend([None] * (tool_call.index + 1 - len(tool_calls)))
-
-                        if tool_calls[tool_call.index] is None:
-                            tool_calls[tool_call.index] = {
+                        call = tool_calls.get(tool_call.index)
+                        if call is None:
+                            call = tool_calls[tool_call.index] = {
                                 "id": tool_call.id,
-                                "function": {"name": "", "arguments": ""}
+                                "name_parts": [],
+                                "arg_parts": []
                             }
 
                         if tool_call.function:
                             if tool_call.function.name:
-                                tool_calls[tool_call.index]["function"]["name"] += tool_call.function.name
+                                call["name_parts"].append(tool_call.function.name)
                             if tool_call.function.arguments:
-                                tool_calls[tool_call.index]["function"]["arguments"] += tool_call.function.arguments
+                                call["arg_parts"].append(tool_call.function.arguments)
 
         # Execute tool calls if any
-        if tool_calls and any(tc for tc in tool_calls if tc):
+        if tool_calls:
             yield {"type": "tool_start", "content": ""}
 
-            for tool_call in tool_calls:
-                if tool_call:
-                    function_name = tool_call["function"]["name"]
-                    try:
-                        arguments = json.loads(tool_call["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        arguments = {}
-
-                    yield {"type": "tool_execution", "content": f"Using {function_name}..."}
-
-                    # Execute via auto-routing
-                    result = await self.execute_openai_function(function_name, arguments)
+            parsed_calls = []
+            for _, tool_call in sorted(tool_calls.items()):
+                function_name = "".join(tool_call["name_parts"])
+                try:
+                    arguments = _json_loads("".join(tool_call["arg_parts"]))
+                except ValueError:
+                    # Covers both json.JSONDecodeError and orjson's variant
+                    arguments = {}
+
+                parsed_calls.append((function_name, arguments))
+                yield {"type": "tool_execution", "content": f"Using {function_name}..."}
+
+            # Execute concurrently via auto-routing - the calls in one model
+            # turn are independent, so latency is the slowest tool, not the sum
+            results = await asyncio.gather(
+                *(self.execute_openai_function(name, args) for name, args in parsed_calls)
+            )
 
-                    if not result["success"]:
-                        yield {"type": "tool_error", "content": f"Tool error: {result.get('error')}"}
+            for (function_name, _), result in zip(parsed_calls, results):
+                if not result["success"]:
+                    yield {"type": "tool_error", "content": f"Tool error: {result.get('error')}"}
 
-        # Save full content for conversation saving
+        # Save full content for conversation saving; the callback may be
+        # sync or a coroutine function
         full_content = "".join(content_chunks)
         if save_conversation_callback:
-            save_conversation_callback(full_content)
+            maybe_coro = save_conversation_callback(full_content)
+            if asyncio.iscoroutine(maybe_coro):
+                await maybe_coro
 
     def get_all_tools_status(self) -> Dict[str, Any]:
         """Get status of all registered tools."""
@@ -7,7 +7,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from mcp_tools.base_mcp import BaseMCPTool, MCPToolError, openai_function
+from .base_mcp import BaseMCPTool, MCPToolError, openai_function
 
 
 class DocumentationMCP(BaseMCPTool):
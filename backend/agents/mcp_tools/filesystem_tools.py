@@ -7,7 +7,7 @@ import os
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from mcp_tools.base_mcp import BaseMCPTool, MCPToolError, openai_function
+from .base_mcp import BaseMCPTool, MCPToolError, openai_function
 
 
 class FileSystemMCP(BaseMCPTool):
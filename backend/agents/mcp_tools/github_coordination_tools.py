@@ -4,9 +4,10 @@ CEO-focused GitHub operations for task management and project coordination.
 """
 
 import os
+import asyncio
 from typing import Dict, Any, List, Optional
-from github import Github
-from mcp_tools.base_mcp import BaseMCPTool, MCPToolError, openai_function
+from .base_mcp import BaseMCPTool, MCPToolError, openai_function
+from .github_tools import _github_client, _authed_user
 
 
 class GitHubCoordinationMCP(BaseMCPTool):
@@ -25,10 +26,21 @@ class GitHubCoordinationMCP(BaseMCPTool):
         if not self.github_token:
             raise MCPToolError("GitHub token is required. Set GITHUB_TOKEN environment variable.")
 
-        self.client = Github(self.github_token)
-        self.user = self.client.get_user()
+        # Shared pooled client - see github_tools._github_client
+        self.client = _github_client(self.github_token)
         self.repo = None  # Will be set when repo URL is provided
 
+    @property
+    def user(self):
+        """
+        Authenticated GitHub user, resolved lazily.
+
+        Constructing the tool no longer costs a GET /user round trip; paths
+        that never need the user (most of them) pay nothing, and the cached
+        lookup in github_tools makes repeat access free.
+        """
+        return _authed_user(self.github_token)
+
     async def _execute_action(self, action: str, **kwargs) -> Any:
         """Execute GitHub coordination action."""
         action_map = {
@@ -505,37 +517,60 @@ class GitHubCoordinationMCP(BaseMCPTool):
                 "default_branch": self.repo.default_branch
             }
 
+            # Commits, issues and languages are independent API calls; fetch
+            # them concurrently so the insights latency is the slowest fetch
+            # rather than the sum of all three
+            # Single-page fetches: materializing a PaginatedList with list()
+            # walks every page, which on a mature repo is dozens of GETs just
+            # to read the head of the history
+            def _fetch_commits():
+                return self.repo.get_commits().get_page(0)[:10]  # Last 10 commits
+
+            def _fetch_issue_stats():
+                # totalCount resolves from the first page's Link header - one
+                # GET per state instead of paging through every issue
+                open_count = self.repo.get_issues(state="open").totalCount
+                closed_sample = len(self.repo.get_issues(state="closed").get_page(0)[:10])
+                return open_count, closed_sample
+
+            def _fetch_languages():
+                return dict(self.repo.get_languages())
+
+            commits_result, issues_result, languages_result = await asyncio.gather(
+                asyncio.to_thread(_fetch_commits),
+                asyncio.to_thread(_fetch_issue_stats),
+                asyncio.to_thread(_fetch_languages),
+                return_exceptions=True
+            )
+
             # Get recent activity
-            try:
-                commits = list(self.repo.get_commits()[:10])  # Last 10 commits
-                insights["recent_commits"] = len(commits)
-                if commits:
+            if isinstance(commits_result, Exception):
+                insights["recent_commits"] = 0
+            else:
+                insights["recent_commits"] = len(commits_result)
+                if commits_result:
                     insights["last_commit"] = {
-                        "sha": commits[0].sha[:8],
-                        "message": commits[0].commit.message.split('\n')[0],
-                        "author": commits[0].commit.author.name,
-                        "date": commits[0].commit.author.date.isoformat()
+                        "sha": commits_result[0].sha[:8],
+                        "message": commits_result[0].commit.message.split('\n')[0],
+                        "author": commits_result[0].commit.author.name,
+                        "date": commits_result[0].commit.author.date.isoformat()
                     }
-            except:
-                insights["recent_commits"] = 0
 
             # Get issue statistics
-            try:
-                open_issues = list(self.repo.get_issues(state="open"))
-                closed_issues = list(self.repo.get_issues(state="closed")[:10])  # Sample
+            if isinstance(issues_result, Exception):
+                insights["issue_stats"] = {"open_count": 0, "closed_sample": 0}
+            else:
+                open_count, closed_sample = issues_result
                 insights["issue_stats"] = {
-                    "open_count": len(open_issues),
-                    "closed_sample": len(closed_issues)
+                    "open_count": open_count,
+                    "closed_sample": closed_sample
                 }
-            except:
-                insights["issue_stats"] = {"open_count": 0, "closed_sample": 0}
 
             # Get languages
-            try:
-                languages = self.repo.get_languages()
-                insights["languages"] = dict(languages)
-            except:
+            if isinstance(languages_result, Exception):
                 insights["languages"] = {}
+            else:
+                insights["languages"] = languages_result
 
             return insights
 
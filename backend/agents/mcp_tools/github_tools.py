@@ -4,13 +4,221 @@ Direct GitHub API integration without server overhead.
 """
 
 import os
+import re
 import json
+import time
+import string
 import asyncio
+import hashlib
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from github import Github
 from pathlib import Path
 
 
+@lru_cache(maxsize=8)
+def _github_client(token: str):
+    """
+    One PyGithub client per token, shared process-wide.
+
+    A fresh client per tool instance means fresh TLS handshakes to
+    api.github.com; sharing the client (with a larger urllib3 pool for
+    concurrent calls) keeps connections warm across all agents.
+
+    PyGithub is imported here, not at module top: it drags in requests,
+    urllib3 and cryptography — several hundred ms of cold-start time that
+    containers which never touch GitHub shouldn't pay.
+    """
+    from github import Github
+    return Github(token, pool_size=32)
+
+
+@lru_cache(maxsize=8)
+def _authed_user(token: str):
+    """
+    Authenticated user for a token, resolved once per process.
+
+    Several agents share one GITHUB_TOKEN, and the /user lookup is an HTTPS
+    round-trip; caching it means every instance after the first pays nothing.
+    """
+    return _github_client(token).get_user()
+
+# Short-lived cache for repository lookups, keyed by (owner, repo_name).
+# Each entry stores (expiry_timestamp, repo_object). Repository objects are
+# refetched after the TTL so metadata doesn't go stale, but repeated file
+# operations against the same repo within a burst cost zero extra API calls.
+_REPO_CACHE_TTL_SECONDS = 60.0
+_repo_cache: Dict[tuple, tuple] = {}
+
+
+def _git_blob_sha(content: bytes) -> str:
+    """Git blob SHA1 for content, as GitHub reports it for file contents."""
+    h = hashlib.sha1()
+    h.update(f"blob {len(content)}\0".encode())
+    h.update(content)
+    return h.hexdigest()
+
+# Slug table built once at import: anything outside [a-z0-9] maps to "-".
+# str.translate runs the per-character work in C instead of a Python loop.
+_SLUG_KEEP = set(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = str.maketrans({c: "-" for c in map(chr, range(128)) if c not in _SLUG_KEEP})
+_HYPHEN_RUN_RE = re.compile(r"-+")
+
+
+def _slugify(name: str) -> str:
+    """Turn an arbitrary name into an npm/URL-safe lowercase slug."""
+    return _HYPHEN_RUN_RE.sub("-", name.lower().translate(_SLUG_TABLE)).strip("-")
+
+
+# Next.js scaffolding templates, built once at import. The static files are
+# plain constants; the ones that mention the project are string.Templates so
+# the parse cost is paid at import instead of on every setup call.
+_NEXT_CONFIG_JS = '''/** @type {import('next').NextConfig} */
+const nextConfig = {
+  experimental: {
+    appDir: true,
+  },
+}
+
+module.exports = nextConfig'''
+
+_TSCONFIG_JSON = json.dumps({
+    "compilerOptions": {
+        "target": "es5",
+        "lib": ["dom", "dom.iterable", "es6"],
+        "allowJs": True,
+        "skipLibCheck": True,
+        "strict": True,
+        "noEmit": True,
+        "esModuleInterop": True,
+        "module": "esnext",
+        "moduleResolution": "bundler",
+        "resolveJsonModule": True,
+        "isolatedModules": True,
+        "jsx": "preserve",
+        "incremental": True,
+        "plugins": [{"name": "next"}],
+        "baseUrl": ".",
+        "paths": {"@/*": ["./*"]}
+    },
+    "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx", ".next/types/**/*.ts"],
+    "exclude": ["node_modules"]
+}, indent=2)
+
+_GLOBALS_CSS = '''@tailwind base;
+@tailwind components;
+@tailwind utilities;
+
+:root {
+  --foreground-rgb: 0, 0, 0;
+  --background-start-rgb: 214, 219, 220;
+  --background-end-rgb: 255, 255, 255;
+}
+
+@media (prefers-color-scheme: dark) {
+  :root {
+    --foreground-rgb: 255, 255, 255;
+    --background-start-rgb: 0, 0, 0;
+    --background-end-rgb: 0, 0, 0;
+  }
+}
+
+body {
+  color: rgb(var(--foreground-rgb));
+  background: linear-gradient(
+      to bottom,
+      transparent,
+      rgb(var(--background-end-rgb))
+    )
+    rgb(var(--background-start-rgb));
+}'''
+
+_LAYOUT_TSX_TEMPLATE = string.Template('''import type { Metadata } from 'next'
+import { Inter } from 'next/font/google'
+import './globals.css'
+
+const inter = Inter({ subsets: ['latin'] })
+
+export const metadata: Metadata = {
+  title: '$project_title',
+  description: '$project_description',
+}
+
+export default function RootLayout({
+  children,
+}: {
+  children: React.ReactNode
+}) {
+  return (
+    <html lang="en">
+      <body className={inter.className}>{children}</body>
+    </html>
+  )
+}''')
+
+_PAGE_TSX_TEMPLATE = string.Template('''export default function Home() {
+  return (
+    <main className="flex min-h-screen flex-col items-center justify-between p-24">
+      <div className="z-10 max-w-5xl w-full items-center justify-between font-mono text-sm">
+        <h1 className="text-4xl font-bold text-center mb-8">
+          $project_title
+        </h1>
+        <p className="text-center text-gray-600 mb-8">
+          $project_description
+        </p>
+        <div className="text-center">
+          <p className="text-sm text-gray-400">
+            🤖 Autonomously created by my-yc AI agents
+          </p>
+        </div>
+      </div>
+    </main>
+  )
+}''')
+
+_ENV_EXAMPLE_TEMPLATE = string.Template('''# $project_title Environment Variables
+NEXT_PUBLIC_APP_NAME="$project_title"
+# Add your environment variables here''')
+
+_README_TEMPLATE = string.Template('''# $project_title
+
+> 🤖 **Autonomous Startup** | Created by AI agents via [my-yc](https://my-yc.com) platform
+
+$project_description
+
+## 🚀 Quick Start
+
+```bash
+npm install
+npm run dev
+```
+
+Open [http://localhost:3000](http://localhost:3000) to see your autonomous startup!
+
+## 🤖 Autonomous Generation
+
+This project was created by AI agents that:
+
+- ✅ Analyzed your startup idea
+- ✅ Generated complete project structure
+- ✅ Set up development environment
+- ✅ Created responsive UI components
+- ✅ Configured for immediate deployment
+
+## 🔄 Next Steps
+
+Deploy and scale autonomously:
+
+- **Deploy**: Ready for Vercel deployment
+- **Develop**: Add features and functionality
+- **Scale**: Self-contained and independent
+- **Integrate**: Database, auth, payments ready
+
+---
+
+*🤖 Autonomously generated by [my-yc](https://my-yc.com) AI agents*
+''')
+
+
 class GitHubMCPTools:
     """Embedded GitHub tools for autonomous agents."""
 
@@ -20,8 +228,24 @@ class GitHubMCPTools:
         if not self.github_token:
             raise ValueError("GitHub token is required. Set GITHUB_TOKEN environment variable.")
 
-        self.client = Github(self.github_token)
-        self.user = self.client.get_user()
+        self.client = _github_client(self.github_token)
+        self.user = _authed_user(self.github_token)
+
+    def _get_repo(self, repo_name: str):
+        """
+        Get a repository object, using a short-lived in-process cache.
+
+        Avoids one GET /repos round-trip (and one rate-limit unit) for every
+        file operation when several operations hit the same repo in a burst.
+        """
+        cache_key = (self.user.login, repo_name)
+        cached = _repo_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        repo = self.user.get_repo(repo_name)
+        _repo_cache[cache_key] = (time.monotonic() + _REPO_CACHE_TTL_SECONDS, repo)
+        return repo
 
     async def create_repository(
         self,
@@ -45,28 +269,37 @@ class GitHubMCPTools:
             Dictionary with repository details and status
         """
         try:
-            # Ensure unique repository name
-            original_name = name
-            counter = 1
+            def _create_unique_repo():
+                # Ensure unique repository name
+                unique_name = name
+                counter = 1
+
+                while True:
+                    try:
+                        # Check if repo already exists
+                        existing = self.user.get_repo(unique_name)
+                        # If we get here, repo exists, try a new name
+                        unique_name = f"{name}-{counter}"
+                        counter += 1
+                    except:
+                        # Repo doesn't exist, we can use this name
+                        break
+
+                # Create the repository
+                return self.user.create_repo(
+                    name=unique_name,
+                    description=f"🤖 {description} | Autonomous startup created by my-yc AI agents",
+                    private=private,
+                    auto_init=auto_init,
+                    gitignore_template=gitignore_template
+                )
 
-            while True:
-                try:
-                    # Check if repo already exists
-                    existing = self.user.get_repo(name)
-                    # If we get here, repo exists, try a new name
-                    name = f"{original_name}-{counter}"
-                    counter += 1
-                except:
-                    # Repo doesn't exist, we can use this name
-                    break
-
-            # Create the repository
-            repo = self.user.create_repo(
-                name=name,
-                description=f"🤖 {description} | Autonomous startup created by my-yc AI agents",
-                private=private,
-                auto_init=auto_init,
-                gitignore_template=gitignore_template
+            # PyGithub is synchronous; run the probe+create off the event loop
+            repo = await asyncio.to_thread(_create_unique_repo)
+
+            # Seed the cache so follow-up file operations skip the lookup
+            _repo_cache[(self.user.login, repo.name)] = (
+                time.monotonic() + _REPO_CACHE_TTL_SECONDS, repo
             )
 
             return {
@@ -76,7 +309,7 @@ class GitHubMCPTools:
                 "clone_url": repo.clone_url,
                 "ssh_url": repo.ssh_url,
                 "default_branch": repo.default_branch,
-                "message": f"Repository '{name}' created successfully",
+                "message": f"Repository '{repo.name}' created successfully",
                 "data": {
                     "full_name": repo.full_name,
                     "created_at": repo.created_at.isoformat(),
@@ -113,36 +346,47 @@ class GitHubMCPTools:
             Dictionary with operation status
         """
         try:
-            repo = self.user.get_repo(repo_name)
-
-            try:
-                # Try to get existing file
-                existing_file = repo.get_contents(file_path, ref=branch)
-                # File exists, update it
-                repo.update_file(
-                    file_path,
-                    commit_message,
-                    content,
-                    existing_file.sha,
-                    branch=branch
-                )
-                action = "updated"
-            except:
-                # File doesn't exist, create it
-                repo.create_file(
-                    file_path,
-                    commit_message,
-                    content,
-                    branch=branch
-                )
-                action = "created"
+            repo = await asyncio.to_thread(self._get_repo, repo_name)
+
+            def _write_file():
+                try:
+                    # Optimistically create: new files (the common case for
+                    # agent scaffolding) cost one PUT instead of GET plus PUT
+                    repo.create_file(
+                        file_path,
+                        commit_message,
+                        content,
+                        branch=branch
+                    )
+                    return "created"
+                except:
+                    # File already exists - fetch its SHA and update
+                    existing_file = repo.get_contents(file_path, ref=branch)
+                    # Skip the write+commit round trip entirely when the
+                    # content on GitHub already matches (retries, re-inits)
+                    if existing_file.sha == _git_blob_sha(content.encode()):
+                        return "unchanged"
+                    repo.update_file(
+                        file_path,
+                        commit_message,
+                        content,
+                        existing_file.sha,
+                        branch=branch
+                    )
+                    return "updated"
+
+            action = await asyncio.to_thread(_write_file)
 
             return {
                 "success": True,
                 "action": action,
                 "file_path": file_path,
                 "repo_name": repo_name,
-                "message": f"File '{file_path}' {action} successfully"
+                "message": (
+                    f"File '{file_path}' already up to date"
+                    if action == "unchanged"
+                    else f"File '{file_path}' {action} successfully"
+                )
             }
 
         except Exception as e:
@@ -152,6 +396,62 @@ class GitHubMCPTools:
                 "message": f"Failed to {action if 'action' in locals() else 'modify'} file '{file_path}': {str(e)}"
             }
 
+    async def create_tree_commit(
+        self,
+        repo_name: str,
+        files: Dict[str, str],
+        commit_message: str,
+        branch: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Commit several files to a repository as a single commit.
+
+        Uses the Git Data API (blob/tree/commit/ref) so N files cost one
+        commit instead of N contents-API PUTs, each of which is a full
+        GitHub round trip plus its own commit.
+
+        Args:
+            repo_name: Name of the repository
+            files: Mapping of file path to file content
+            commit_message: Commit message for the batch
+            branch: Target branch (defaults to the repo's default branch)
+
+        Returns:
+            Dictionary with commit status
+        """
+        try:
+            from github import InputGitTreeElement
+            repo = await asyncio.to_thread(self._get_repo, repo_name)
+
+            def _commit_tree():
+                ref = repo.get_git_ref(f"heads/{branch or repo.default_branch}")
+                base_commit = repo.get_git_commit(ref.object.sha)
+                elements = [
+                    InputGitTreeElement(path, "100644", "blob", content=content)
+                    for path, content in files.items()
+                ]
+                tree = repo.create_git_tree(elements, base_commit.tree)
+                commit = repo.create_git_commit(commit_message, tree, [base_commit])
+                ref.edit(commit.sha)
+                return commit.sha
+
+            commit_sha = await asyncio.to_thread(_commit_tree)
+
+            return {
+                "success": True,
+                "commit_sha": commit_sha,
+                "files": list(files.keys()),
+                "repo_name": repo_name,
+                "message": f"Committed {len(files)} files in a single commit"
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"Failed to commit files to '{repo_name}': {str(e)}"
+            }
+
     async def setup_nextjs_project(
         self,
         repo_name: str,
@@ -170,13 +470,19 @@ class GitHubMCPTools:
             Dictionary with setup status and created files
         """
         try:
-            repo = self.user.get_repo(repo_name)
+            repo = await asyncio.to_thread(self._get_repo, repo_name)
             created_files = []
 
-            # Project templates
+            # Fill in the project-specific templates; the static files and
+            # compiled templates live at module scope.
+            fields = {
+                "project_title": project_title,
+                "project_description": project_description,
+            }
+
             templates = {
-                "package.json": {
-                    "name": repo_name.lower().replace(" ", "-"),
+                "package.json": json.dumps({
+                    "name": _slugify(repo_name),
                     "version": "0.1.0",
                     "private": True,
                     "description": project_description,
@@ -199,168 +505,57 @@ class GitHubMCPTools:
                         "eslint": "^8.57.0",
                         "eslint-config-next": "^14.2.0"
                     }
-                },
-
-                "next.config.js": '''/** @type {import('next').NextConfig} */
-const nextConfig = {
-  experimental: {
-    appDir: true,
-  },
-}
-
-module.exports = nextConfig''',
-
-                "tsconfig.json": {
-                    "compilerOptions": {
-                        "target": "es5",
-                        "lib": ["dom", "dom.iterable", "es6"],
-                        "allowJs": True,
-                        "skipLibCheck": True,
-                        "strict": True,
-                        "noEmit": True,
-                        "esModuleInterop": True,
-                        "module": "esnext",
-                        "moduleResolution": "bundler",
-                        "resolveJsonModule": True,
-                        "isolatedModules": True,
-                        "jsx": "preserve",
-                        "incremental": True,
-                        "plugins": [{"name": "next"}],
-                        "baseUrl": ".",
-                        "paths": {"@/*": ["./*"]}
-                    },
-                    "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx", ".next/types/**/*.ts"],
-                    "exclude": ["node_modules"]
-                },
-
-                "app/layout.tsx": f'''import type {{ Metadata }} from 'next'
-import {{ Inter }} from 'next/font/google'
-import './globals.css'
-
-const inter = Inter({{ subsets: ['latin'] }})
-
-export const metadata: Metadata = {{
-  title: '{project_title}',
-  description: '{project_description}',
-}}
-
-export default function RootLayout({{
-  children,
-}}: {{
-  children: React.ReactNode
-}}) {{
-  return (
-    <html lang="en">
-      <body className={{inter.className}}>{{children}}</body>
-    </html>
-  )
-}}''',
-
-                "app/page.tsx": f'''export default function Home() {{
-  return (
-    <main className="flex min-h-screen flex-col items-center justify-between p-24">
-      <div className="z-10 max-w-5xl w-full items-center justify-between font-mono text-sm">
-        <h1 className="text-4xl font-bold text-center mb-8">
-          {project_title}
-        </h1>
-        <p className="text-center text-gray-600 mb-8">
-          {project_description}
-        </p>
-        <div className="text-center">
-          <p className="text-sm text-gray-400">
-            🤖 Autonomously created by my-yc AI agents
-          </p>
-        </div>
-      </div>
-    </main>
-  )
-}}''',
-
-                "app/globals.css": '''@tailwind base;
-@tailwind components;
-@tailwind utilities;
-
-:root {
-  --foreground-rgb: 0, 0, 0;
-  --background-start-rgb: 214, 219, 220;
-  --background-end-rgb: 255, 255, 255;
-}
-
-@media (prefers-color-scheme: dark) {
-  :root {
-    --foreground-rgb: 255, 255, 255;
-    --background-start-rgb: 0, 0, 0;
-    --background-end-rgb: 0, 0, 0;
-  }
-}
-
-body {
-  color: rgb(var(--foreground-rgb));
-  background: linear-gradient(
-      to bottom,
-      transparent,
-      rgb(var(--background-end-rgb))
-    )
-    rgb(var(--background-start-rgb));
-}''',
-
-                ".env.example": f'''# {project_title} Environment Variables
-NEXT_PUBLIC_APP_NAME="{project_title}"
-# Add your environment variables here''',
-
-                "README.md": f'''# {project_title}
-
-> 🤖 **Autonomous Startup** | Created by AI agents via [my-yc](https://my-yc.com) platform
-
-{project_description}
-
-## 🚀 Quick Start
-
-```bash
-npm install
-npm run dev
-```
-
-Open [http://localhost:3000](http://localhost:3000) to see your autonomous startup!
-
-## 🤖 Autonomous Generation
-
-This project was created by AI agents that:
-
-- ✅ Analyzed your startup idea
-- ✅ Generated complete project structure
-- ✅ Set up development environment
-- ✅ Created responsive UI components
-- ✅ Configured for immediate deployment
-
-## 🔄 Next Steps
+                }, indent=2),
+                "next.config.js": _NEXT_CONFIG_JS,
+                "tsconfig.json": _TSCONFIG_JSON,
+                "app/layout.tsx": _LAYOUT_TSX_TEMPLATE.substitute(fields),
+                "app/page.tsx": _PAGE_TSX_TEMPLATE.substitute(fields),
+                "app/globals.css": _GLOBALS_CSS,
+                ".env.example": _ENV_EXAMPLE_TEMPLATE.substitute(fields),
+                "README.md": _README_TEMPLATE.substitute(fields),
+            }
 
-Deploy and scale autonomously:
+            # Land the whole scaffold as one Git Data API commit: a single
+            # tree + commit + ref update instead of one PUT per file
+            commit_result = await self.create_tree_commit(
+                repo_name,
+                templates,
+                f"Scaffold Next.js project '{project_title}'"
+            )
+            if commit_result.get("success"):
+                return {
+                    "success": True,
+                    "created_files": list(templates.keys()),
+                    "commit_sha": commit_result.get("commit_sha"),
+                    "repo_name": repo_name,
+                    "project_type": "nextjs",
+                    "message": f"Next.js project '{project_title}' set up successfully"
+                }
 
-- **Deploy**: Ready for Vercel deployment
-- **Develop**: Add features and functionality
-- **Scale**: Self-contained and independent
-- **Integrate**: Database, auth, payments ready
+            print(f"Warning: tree commit failed ({commit_result.get('error')}); falling back to per-file creation")
 
----
+            # Create all files concurrently so setup latency is the slowest
+            # upload, not the sum of eight round trips
+            def _create(path, content):
+                repo.create_file(path, f"Initialize {path}", content)
 
-*🤖 Autonomously generated by [my-yc](https://my-yc.com) AI agents*
-'''
-            }
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_create, fp, fc) for fp, fc in templates.items()),
+                return_exceptions=True
+            )
 
-            # Create all files
-            for file_path, content in templates.items():
-                if isinstance(content, dict):
-                    file_content = json.dumps(content, indent=2)
+            # GitHub's contents API commits serially per branch, so parallel
+            # PUTs can race on the branch head; retry losers once in sequence
+            retries = []
+            for (file_path, file_content), result in zip(templates.items(), results):
+                if isinstance(result, Exception):
+                    retries.append((file_path, file_content))
                 else:
-                    file_content = content
+                    created_files.append(file_path)
 
+            for file_path, file_content in retries:
                 try:
-                    repo.create_file(
-                        file_path,
-                        f"Initialize {file_path}",
-                        file_content
-                    )
+                    await asyncio.to_thread(_create, file_path, file_content)
                     created_files.append(file_path)
                 except Exception as file_error:
                     print(f"Warning: Could not create {file_path}: {file_error}")
@@ -391,7 +586,7 @@ Deploy and scale autonomously:
             Dictionary with repository information
         """
         try:
-            repo = self.user.get_repo(repo_name)
+            repo = await asyncio.to_thread(self._get_repo, repo_name)
 
             return {
                 "success": True,
@@ -9,7 +9,7 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from mcp_tools.base_mcp import BaseMCPTool, MCPToolError, openai_function
+from .base_mcp import BaseMCPTool, MCPToolError, openai_function
 
 
 class TeamToolsMCP(BaseMCPTool):
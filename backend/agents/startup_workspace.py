@@ -4,12 +4,120 @@ Replaces the expensive CEO-only containers with a cost-effective shared workspac
 Cost: ~$1/month per startup vs $90/month with persistent memory across all agents.
 """
 
+import asyncio
 import modal
 import json
 import os
+import time
 from typing import Dict, Any, Optional
+from collections import OrderedDict
 from datetime import datetime
 
+# Agent roster exposed by workspace endpoints, allocated once at module load
+AVAILABLE_AGENTS = ["ceo", "frontend", "backend", "design", "testing"]
+
+
+# Workspace modules, imported once per container. Every endpoint used to
+# repeat the sys.path fix-up and imports per request; warm calls paid the
+# importlib lock and lookups each time for modules that never change.
+_workspace_modules = None
+
+
+def _get_workspace_modules():
+    """Import and cache (WorkspaceManager, AgentOrchestrator) per process."""
+    global _workspace_modules
+    if _workspace_modules is None:
+        import sys
+        if "/root" not in sys.path:
+            sys.path.insert(0, "/root")
+        from workspace_manager import WorkspaceManager
+        from agent_orchestrator import AgentOrchestrator
+        _workspace_modules = (WorkspaceManager, AgentOrchestrator)
+    return _workspace_modules
+
+
+# Reused per-startup orchestrators on a warm container. Construction builds
+# the whole MCP tool registry (five tool instances plus GitHub client wiring),
+# which repeated turns of one conversation shouldn't pay per message.
+# Bounded so a long-lived container serving many startups can't grow forever;
+# conversation state lives on the volume, so eviction only costs a rebuild.
+_ORCHESTRATOR_CACHE_SIZE = 32
+_orchestrator_cache = OrderedDict()
+
+
+def _workspace_mgr():
+    """
+    Process-wide WorkspaceManager singleton (it holds no per-request state).
+
+    Imports only workspace_manager, not the orchestrator stack, so the
+    read-only endpoints on the slim image can use it without openai/PyGithub.
+    """
+    import sys
+    if "/root" not in sys.path:
+        sys.path.insert(0, "/root")
+    from workspace_manager import get_workspace_manager
+    return get_workspace_manager()
+
+
+def _get_orchestrator(startup_id: str):
+    """Get (or build and cache) the orchestrator for a startup."""
+    _, AgentOrchestrator = _get_workspace_modules()
+    orchestrator = _orchestrator_cache.get(startup_id)
+    if orchestrator is None:
+        orchestrator = AgentOrchestrator(startup_id, _workspace_mgr())
+        _orchestrator_cache[startup_id] = orchestrator
+        if len(_orchestrator_cache) > _ORCHESTRATOR_CACHE_SIZE:
+            _orchestrator_cache.popitem(last=False)
+    else:
+        _orchestrator_cache.move_to_end(startup_id)
+    return orchestrator
+
+
+# Workspace count for health checks: (expiry, count), refreshed lazily
+_WORKSPACE_COUNT_TTL_SECONDS = 60.0
+_workspace_count_cache = (0.0, 0)
+
+
+# Strong references to fire-and-forget tasks; without them the event loop
+# only holds a weak reference and a task can be GC'd mid-flight
+_background_tasks = set()
+
+
+def _reap_background_task(task):
+    _background_tasks.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieve so failures don't warn at GC time
+
+
+def _touch_activity(workspace_mgr, startup_id: str):
+    """
+    Record workspace activity without blocking the response.
+
+    The timestamp write is bookkeeping on the shared volume; clients
+    shouldn't wait on that disk round trip before seeing their reply.
+    """
+    task = asyncio.create_task(
+        asyncio.to_thread(workspace_mgr.update_last_activity, startup_id)
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_reap_background_task)
+
+
+def _enable_eager_tasks():
+    """
+    Switch the running event loop to eager task execution (Python 3.12+).
+
+    Coroutines that complete without blocking then finish synchronously
+    instead of taking a scheduling round trip — a measurable win for the
+    many small awaits in agent invocation. No-op on older interpreters.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is not factory:
+        loop.set_task_factory(factory)
+
 # SHARED app name - all startups use this app, containers differentiated by startup_id
 app = modal.App("my-yc-startup-workspaces")
 
@@ -17,12 +125,13 @@ app = modal.App("my-yc-startup-workspaces")
 startup_workspaces = modal.Volume.from_name("startup-workspaces", create_if_missing=True)
 
 # Optimized container image with all dependencies
-image = modal.Image.debian_slim(python_version="3.11").pip_install(
+image = modal.Image.debian_slim(python_version="3.12").pip_install(
     "openai>=1.0.0",
     "PyGithub>=1.59.0",
     "fastapi>=0.100.0",
     "pydantic>=2.0.0",
-    "gitpython>=3.1.0"
+    "gitpython>=3.1.0",
+    "orjson>=3.9.0"
 ).add_local_file(
     local_path="agent_orchestrator.py",
     remote_path="/root/agent_orchestrator.py"
@@ -37,6 +146,17 @@ image = modal.Image.debian_slim(python_version="3.11").pip_install(
     remote_path="/root/mcp_tools"
 )
 
+# Slim image for the read-only endpoints. Status, team board and health never
+# touch OpenAI or GitHub, so they shouldn't pull those wheels (or gitpython)
+# on every cold start; they only need FastAPI plus the workspace reader.
+status_image = modal.Image.debian_slim(python_version="3.12").pip_install(
+    "fastapi>=0.100.0",
+    "pydantic>=2.0.0"
+).add_local_file(
+    local_path="workspace_manager.py",
+    remote_path="/root/workspace_manager.py"
+)
+
 @app.function(
     image=image,
     secrets=[modal.Secret.from_name("my-yc-secrets")],
@@ -52,12 +172,9 @@ async def initialize_workspace(request_data: Dict[str, Any]):
     Initialize workspace for a startup with all agent infrastructure.
     Endpoint: https://jakowiren--my-yc-startup-workspaces-initialize.modal.run
     """
+    _enable_eager_tasks()
+
     try:
-        # Import modules inside the function
-        import sys
-        sys.path.insert(0, "/root")
-        from workspace_manager import WorkspaceManager
-        from agent_orchestrator import AgentOrchestrator
 
         startup_id = request_data.get("startup_id")
         design_doc = request_data.get("design_doc")
@@ -72,12 +189,12 @@ async def initialize_workspace(request_data: Dict[str, Any]):
         startup_name = design_doc.get("title", f"Startup {startup_id}")
 
         # Initialize workspace manager
-        workspace_mgr = WorkspaceManager()
+        workspace_mgr = _workspace_mgr()
 
         # Check if workspace already exists
         if workspace_mgr.workspace_exists(startup_id):
             print(f"📁 Workspace already exists for {startup_id}")
-            workspace_info = workspace_mgr.get_workspace_info(startup_id)
+            workspace_info = await asyncio.to_thread(workspace_mgr.get_workspace_info, startup_id)
             result = {
                 "success": True,
                 "startup_id": startup_id,
@@ -85,15 +202,18 @@ async def initialize_workspace(request_data: Dict[str, Any]):
                 "message": f"Workspace resumed for '{startup_name}'",
                 "workspace_info": workspace_info,
                 "container_status": "warm",
-                "available_agents": ["ceo", "frontend", "backend", "design", "testing"]
+                "available_agents": AVAILABLE_AGENTS
             }
         else:
             print(f"🏗️ Creating new workspace for {startup_id}")
-            # Initialize workspace with multi-agent support
-            workspace_path = workspace_mgr.initialize_workspace(startup_id, startup_name, design_doc)
+            # Initialize workspace with multi-agent support. The directory
+            # scaffolding is blocking volume I/O, so keep it off the loop.
+            workspace_path = await asyncio.to_thread(
+                workspace_mgr.initialize_workspace, startup_id, startup_name, design_doc
+            )
 
             # Initialize agent orchestrator
-            orchestrator = AgentOrchestrator(startup_id, workspace_mgr)
+            orchestrator = _get_orchestrator(startup_id)
 
             # Initialize CEO agent (primary agent)
             await orchestrator.initialize_agent("ceo", design_doc)
@@ -105,12 +225,12 @@ async def initialize_workspace(request_data: Dict[str, Any]):
                 "message": f"Workspace created for '{startup_name}'",
                 "workspace_path": str(workspace_path),
                 "container_status": "cold_start",
-                "available_agents": ["ceo", "frontend", "backend", "design", "testing"],
+                "available_agents": AVAILABLE_AGENTS,
                 "cold_start_time": datetime.now().isoformat()
             }
 
-        # Update workspace activity
-        workspace_mgr.update_last_activity(startup_id)
+        # Update workspace activity (off the critical path)
+        _touch_activity(workspace_mgr, startup_id)
 
         print(f"✅ Workspace initialization complete: {result}")
         return result
@@ -123,6 +243,63 @@ async def initialize_workspace(request_data: Dict[str, Any]):
             "startup_id": request_data.get("startup_id")
         }
 
+@app.function(
+    image=image,
+    secrets=[modal.Secret.from_name("my-yc-secrets")],
+    timeout=300,
+    cpu=1.0,
+    memory=2048,
+    # NO min_containers! Cold starts are still accepted to save money.
+    volumes={"/workspace": startup_workspaces}
+)
+# Most of a chat turn is awaiting OpenAI/GitHub I/O, so one container can
+# interleave several conversations
+@modal.concurrent(max_inputs=8)
+@modal.fastapi_endpoint(method="POST", label="workspace-init-chat")
+async def initialize_and_chat(request_data: Dict[str, Any]):
+    """
+    Initialize a workspace and deliver the first message in one invocation.
+    The common "create and greet" flow otherwise pays two Modal round trips
+    (container spin + import + auth each); this shares one warm container.
+    Endpoint: https://jakowiren--my-yc-startup-workspaces-init-chat.modal.run
+    """
+    _enable_eager_tasks()
+
+    # Reuse the initialization endpoint body on this same container
+    init_result = await initialize_workspace.local(request_data)
+    if not init_result.get("success"):
+        return init_result
+
+    message = request_data.get("message")
+    if not message:
+        return init_result
+
+    try:
+
+        startup_id = request_data.get("startup_id")
+        agent_type = request_data.get("agent_type", "ceo")
+
+        # Workspace is freshly scaffolded above; invoke on the warm container
+        workspace_mgr = _workspace_mgr()
+        orchestrator = _get_orchestrator(startup_id)
+        response = await orchestrator.invoke_agent(agent_type=agent_type, message=message)
+
+        return {
+            **init_result,
+            "agent_type": agent_type,
+            "response": response.get("content", ""),
+            "tools_used": response.get("tools_used", []),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        # Initialization succeeded; report the chat failure without undoing it
+        print(f"❌ First-message invocation failed: {str(e)}")
+        return {
+            **init_result,
+            "chat_error": f"Agent invocation failed: {str(e)}"
+        }
+
 @app.function(
     image=image,
     secrets=[modal.Secret.from_name("my-yc-secrets")],
@@ -132,18 +309,16 @@ async def initialize_workspace(request_data: Dict[str, Any]):
     # NO min_containers!
     volumes={"/workspace": startup_workspaces}
 )
+@modal.concurrent(max_inputs=8)
 @modal.fastapi_endpoint(method="POST", label="workspace-agent-invoke")
 async def invoke_agent(request_data: Dict[str, Any]):
     """
     Universal agent invocation endpoint - routes to any agent type.
     Endpoint: https://jakowiren--my-yc-startup-workspaces-agent-invoke.modal.run
     """
+    _enable_eager_tasks()
+
     try:
-        # Import modules inside the function
-        import sys
-        sys.path.insert(0, "/root")
-        from workspace_manager import WorkspaceManager
-        from agent_orchestrator import AgentOrchestrator
 
         startup_id = request_data.get("startup_id")
         agent_type = request_data.get("agent_type", "ceo")  # Default to CEO
@@ -159,7 +334,7 @@ async def invoke_agent(request_data: Dict[str, Any]):
         print(f"🤖 Agent invocation: {agent_type} for startup {startup_id}")
 
         # Initialize workspace manager
-        workspace_mgr = WorkspaceManager()
+        workspace_mgr = _workspace_mgr()
 
         # Check if workspace exists
         if not workspace_mgr.workspace_exists(startup_id):
@@ -171,7 +346,7 @@ async def invoke_agent(request_data: Dict[str, Any]):
             }
 
         # Initialize agent orchestrator
-        orchestrator = AgentOrchestrator(startup_id, workspace_mgr)
+        orchestrator = _get_orchestrator(startup_id)
 
         # Invoke the specified agent
         response = await orchestrator.invoke_agent(
@@ -180,8 +355,8 @@ async def invoke_agent(request_data: Dict[str, Any]):
             context=context
         )
 
-        # Update workspace activity
-        workspace_mgr.update_last_activity(startup_id)
+        # Update workspace activity (off the critical path)
+        _touch_activity(workspace_mgr, startup_id)
 
         return {
             "success": True,
@@ -210,6 +385,7 @@ async def invoke_agent(request_data: Dict[str, Any]):
     memory=2048,
     volumes={"/workspace": startup_workspaces}
 )
+@modal.concurrent(max_inputs=8)
 @modal.fastapi_endpoint(method="POST", label="workspace-agent-stream")
 async def invoke_agent_streaming(request_data: Dict[str, Any]):
     """
@@ -219,12 +395,10 @@ async def invoke_agent_streaming(request_data: Dict[str, Any]):
     print(f"🎬 STREAMING ENDPOINT CALLED")
     print(f"🎬 Request data: {request_data}")
 
+    _enable_eager_tasks()
+
     try:
         # Import modules inside the function
-        import sys
-        sys.path.insert(0, "/root")
-        from workspace_manager import WorkspaceManager
-        from agent_orchestrator import AgentOrchestrator
         from fastapi.responses import StreamingResponse
 
         startup_id = request_data.get("startup_id")
@@ -243,7 +417,7 @@ async def invoke_agent_streaming(request_data: Dict[str, Any]):
         print(f"💬 Streaming agent: {agent_type} for startup {startup_id}")
 
         # Initialize workspace manager
-        workspace_mgr = WorkspaceManager()
+        workspace_mgr = _workspace_mgr()
 
         # Check if workspace exists
         print(f"🎬 Checking if workspace exists for {startup_id}")
@@ -256,7 +430,7 @@ async def invoke_agent_streaming(request_data: Dict[str, Any]):
         print(f"✅ Workspace exists for {startup_id}")
 
         # Initialize agent orchestrator
-        orchestrator = AgentOrchestrator(startup_id, workspace_mgr)
+        orchestrator = _get_orchestrator(startup_id)
 
         async def generate_stream():
             """Generate Server-Sent Events stream."""
@@ -281,8 +455,8 @@ async def invoke_agent_streaming(request_data: Dict[str, Any]):
             except Exception as e:
                 yield f"data: {json.dumps({'error': str(e), 'agent': agent_type})}\n\n"
 
-        # Update workspace activity
-        workspace_mgr.update_last_activity(startup_id)
+        # Update workspace activity (off the critical path)
+        _touch_activity(workspace_mgr, startup_id)
 
         print(f"🎬 Returning StreamingResponse for {startup_id}")
         return StreamingResponse(
@@ -304,7 +478,7 @@ async def invoke_agent_streaming(request_data: Dict[str, Any]):
         }
 
 @app.function(
-    image=image,
+    image=status_image,
     timeout=30,
     cpu=0.5,  # Very minimal resources for status checks
     memory=512,
@@ -318,14 +492,11 @@ async def get_workspace_status(startup_id: str):
     """
     try:
         # Import modules inside the function
-        import sys
-        sys.path.insert(0, "/root")
-        from workspace_manager import WorkspaceManager
 
         print(f"📊 Status request for startup: {startup_id}")
 
         # Initialize workspace manager
-        workspace_mgr = WorkspaceManager()
+        workspace_mgr = _workspace_mgr()
 
         # Check if workspace exists
         if not workspace_mgr.workspace_exists(startup_id):
@@ -336,14 +507,19 @@ async def get_workspace_status(startup_id: str):
                 "container_status": "cold"
             }
 
-        # Get workspace info
-        workspace_info = workspace_mgr.get_workspace_info(startup_id)
+        # Get workspace info and team messages concurrently - both are
+        # independent blocking disk reads, so wall-clock ≈ max instead of sum
+        info_task = asyncio.to_thread(workspace_mgr.get_workspace_info, startup_id)
+        if hasattr(workspace_mgr, 'get_team_messages'):
+            workspace_info, team_messages = await asyncio.gather(
+                info_task,
+                asyncio.to_thread(workspace_mgr.get_team_messages, startup_id)
+            )
+        else:
+            workspace_info, team_messages = await info_task, []
 
         # Get available agents
-        available_agents = ["ceo", "frontend", "backend", "design", "testing"]
-
-        # Check team message board
-        team_messages = workspace_mgr.get_team_messages(startup_id) if hasattr(workspace_mgr, 'get_team_messages') else []
+        available_agents = AVAILABLE_AGENTS
 
         return {
             "startup_id": startup_id,
@@ -368,7 +544,7 @@ async def get_workspace_status(startup_id: str):
         }
 
 @app.function(
-    image=image,
+    image=status_image,
     timeout=30,
     cpu=0.5,
     memory=512,
@@ -382,14 +558,11 @@ async def get_team_board(startup_id: str):
     """
     try:
         # Import modules inside the function
-        import sys
-        sys.path.insert(0, "/root")
-        from workspace_manager import WorkspaceManager
 
         print(f"📋 Team board request for startup: {startup_id}")
 
         # Initialize workspace manager
-        workspace_mgr = WorkspaceManager()
+        workspace_mgr = _workspace_mgr()
 
         if not workspace_mgr.workspace_exists(startup_id):
             return {
@@ -417,7 +590,7 @@ async def get_team_board(startup_id: str):
         }
 
 @app.function(
-    image=image,
+    image=status_image,
     timeout=10,
     cpu=0.25,
     memory=256
@@ -429,13 +602,21 @@ async def health_check():
     Health check endpoint.
     Endpoint: https://jakowiren--my-yc-startup-workspaces-health.modal.run
     """
-    import os
-    workspace_count = 0
-    try:
-        if os.path.exists("/workspace"):
-            workspace_count = len([d for d in os.listdir("/workspace") if os.path.isdir(os.path.join("/workspace", d))])
-    except Exception:
+    global _workspace_count_cache
+
+    # Recount at most once per TTL; health pollers don't need a fresh volume
+    # scan per probe, and scandir avoids listdir's stat-per-entry cost
+    expiry, workspace_count = _workspace_count_cache
+    now = time.monotonic()
+    if now >= expiry:
         workspace_count = 0
+        try:
+            if os.path.exists("/workspace"):
+                with os.scandir("/workspace") as entries:
+                    workspace_count = sum(1 for entry in entries if entry.is_dir())
+        except Exception:
+            workspace_count = 0
+        _workspace_count_cache = (now + _WORKSPACE_COUNT_TTL_SECONDS, workspace_count)
 
     return {
         "status": "healthy",
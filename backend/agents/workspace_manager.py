@@ -132,12 +132,14 @@ class WorkspaceManager:
         # Create empty conversation log
         (ceo_memory / "conversations.jsonl").touch()
 
-        # Create decisions log
+        # Create decisions log (single buffered write instead of four)
         with open(ceo_memory / "decisions.md", "w") as f:
-            f.write(f"# Strategic Decisions for {startup_name}\n\n")
-            f.write(f"CEO initialized on {datetime.now().strftime('%Y-%m-%d')}\n\n")
-            f.write("## Key Decisions\n\n")
-            f.write("*Decisions will be logged here as the CEO makes them*\n")
+            f.write(
+                f"# Strategic Decisions for {startup_name}\n\n"
+                f"CEO initialized on {datetime.now().strftime('%Y-%m-%d')}\n\n"
+                "## Key Decisions\n\n"
+                "*Decisions will be logged here as the CEO makes them*\n"
+            )
 
     def _initialize_team_structure(self, workspace: Path):
         """Initialize team coordination and communication structures."""